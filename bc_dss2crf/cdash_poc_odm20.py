@@ -7,17 +7,24 @@ SCRIPT_DIR = Path.cwd()
 sys.path.append(str(SCRIPT_DIR))
 
 import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 import logging
 import click
-import pandas as pd
 import requests
 
+import odmlib
 import odmlib.odm_2_0.model as ODM
 from config.config import AppSettings as CFG
 from odmlib import loader as LO
 from odmlib import odm_loader as OL
-from utilities.utils import (create_directory, transform_xml_saxonche,
-                             validate_odm_xml_file, update_zip_file)
+from utilities.utils import (create_directory, get_saxon_transformer,
+                             validate_odm_xml_file, write_zip_entries, read_excel_cached, content_hash,
+                             read_metadata_table, read_build_manifest, write_build_manifest,
+                             validate_odm_xml_bytes, transform_xml_bytes_saxonche)
+from utilities.pipeline import Pipeline, Stage
 
 logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
@@ -33,6 +40,42 @@ CRF_SPECIALIZATIONS_METADATA_EXCEL = __config.crf_specializations_metadata_excel
 CRF_SPECIALIZATIONS_METADATA_EXCEL_SHEET = __config.crf_specializations_metadata_excel_sheet
 FORMS_METADATA_EXCEL = __config.forms_metadata_excel
 FORMS_METADATA_EXCEL_SHEET = __config.forms_metadata_excel_sheet
+METADATA_CACHE_PATH = __config.metadata_cache_path
+
+# CRF specialization columns used by create_df_for_form and create_odm, with their dtypes;
+# the other columns of the metadata are not loaded
+CRF_METADATA_COLUMNS = {
+    "bc_id": str,
+    "vlm_group_id": str,
+    "crf_group_id": str,
+    "short_name": str,
+    "crf_item": str,
+    "variable_name": str,
+    "question_text": str,
+    "prompt": str,
+    "order_number": "int64",
+    "mandatory_variable": "category",
+    "data_type": "category",
+    "length": str,
+    "display_hidden": "category",
+    "codelist": str,
+    "codelist_submission_value": str,
+    "value_list": str,
+    "value_display_list": str,
+    "prepopulated_term": str,
+    "prepopulated_code": str,
+    "sdtm_annotation": str,
+}
+CRF_METADATA_CONVERTERS = {}
+
+ODM_XML_SCHEMA_FILE = Path(__config.odm20_schema)
+XSL_FILE = Path(__config.odm20_stylesheet)
+
+# Manifest of the input hash and artifacts of each form generated in incremental mode
+MANIFEST_FILE = Path(CRF_PATH).joinpath("manifest_odmv2-0.json")
+# Source files of the generator; a change in them regenerates all forms in incremental mode
+GENERATOR_FILES = (Path(__file__), SCRIPT_DIR.joinpath("utilities", "utils.py"))
+
 
 MANDATORY_MAP = {
     "Y": "Yes",
@@ -45,38 +88,87 @@ REPEATING_MAP = {
 }
 
 
+OID_TEMPLATES = {
+    "ODM": lambda r: "ODM.CDASH.POC",
+    "STUDY": lambda r: "ODM.CDASH.STUDY",
+    "MDV": lambda r: "ODM.CDASH.STUDY.MDV",
+    "FORM": lambda r: f"IG.{r['form_id']}",
+    "SECTION": lambda r: f"IG.{r['form_section_id']}_{r['form_section_order_number']}",
+    "CONCEPT": lambda r: (
+        f"IG.{r['form_section_id']}_{r['form_section_order_number']}_"
+        f"{r['crf_group_id']}_{r['bc_order_number']}"
+    ),
+    "ITEM": lambda r: (
+        f"IT.{r['form_section_id']}_{r['form_section_order_number']}_"
+        f"{r['crf_group_id']}_{r['bc_order_number']}."
+        f"{r['crf_item']}"
+    ),
+    "CODELIST": lambda r: (
+        f"CL.{r['form_section_id']}_{r['crf_group_id']}_{r['bc_order_number']}."
+        f"{r['crf_item']}.{r['codelist']}"
+    ),
+    "CODELIST_VL": lambda r: (
+        f"CL.{r['form_section_id']}_{r['crf_group_id']}_{r['bc_order_number']}."
+        f"{r['crf_item']}"
+    ),
+}
+
+
 def create_oid(type, row):
-    type = type.upper()
-    oid_map = {
-        "ODM": lambda r: "ODM.CDASH.POC",
-        "STUDY": lambda r: "ODM.CDASH.STUDY",
-        "MDV": lambda r: "ODM.CDASH.STUDY.MDV",
-        "FORM": lambda r: f"IG.{r['form_id']}",
-        "SECTION": lambda r: f"IG.{r['form_section_id']}_{r['form_section_order_number']}",
-        "CONCEPT": lambda r: (
-            f"IG.{r['form_section_id']}_{r['form_section_order_number']}_"
-            f"{r['crf_group_id']}_{r['bc_order_number']}"
-        ),
-        "ITEM": lambda r: (
-            f"IT.{r['form_section_id']}_{r['form_section_order_number']}_"
-            f"{r['crf_group_id']}_{r['bc_order_number']}."
-            f"{r['crf_item']}"
-        ),
-        "CODELIST": lambda r: (
-            f"CL.{r['form_section_id']}_{r['crf_group_id']}_{r['bc_order_number']}."
-            f"{r['crf_item']}.{r['codelist']}"
-        ),
-        "CODELIST_VL": lambda r: (
-            f"CL.{r['form_section_id']}_{r['crf_group_id']}_{r['bc_order_number']}."
-            f"{r['crf_item']}"
-        ),
-    }
     try:
-        return oid_map[type](row)
+        return OID_TEMPLATES[type.upper()](row)
     except KeyError:
         raise ValueError("Invalid type specified")
 
 
+def frame_columns(df):
+    """
+    Reads each column of a DataFrame once as a plain list, so rows can be built without pandas indexing.
+    Args:
+        df (pd.DataFrame): The DataFrame to read.
+    Returns:
+        dict: The values of each column as a list, keyed by column name.
+    """
+    return {name: df[name].tolist() for name in df.columns}
+
+
+def add_oid_columns(columns):
+    """
+    Adds the OIDs create_odm needs as columns, so they are built once per column instead of per row and per use.
+
+    The section_oid, concept_oid, item_oid, codelist_oid and codelist_vl_oid columns hold the same values
+    as create_oid with the SECTION, CONCEPT, ITEM, CODELIST and CODELIST_VL types.
+    Args:
+        columns (dict): The columns of a DataFrame returned by create_df_for_form, as returned by frame_columns.
+    Returns:
+        dict: The columns, with the OID columns added.
+    """
+    sections = [f"{section_id}_{order_number}" for section_id, order_number
+                in zip(columns["form_section_id"], columns["form_section_order_number"])]
+    concepts = [f"{group_id}_{order_number}" for group_id, order_number
+                in zip(columns["crf_group_id"], columns["bc_order_number"])]
+    columns["section_oid"] = [f"IG.{section}" for section in sections]
+    columns["concept_oid"] = [f"IG.{section}_{concept}" for section, concept in zip(sections, concepts)]
+    columns["item_oid"] = [f"IT.{section}_{concept}.{crf_item}" for section, concept, crf_item
+                           in zip(sections, concepts, columns["crf_item"])]
+    columns["codelist_vl_oid"] = [f"CL.{section_id}_{concept}.{crf_item}" for section_id, concept, crf_item
+                                  in zip(columns["form_section_id"], concepts, columns["crf_item"])]
+    columns["codelist_oid"] = [f"{codelist_vl_oid}.{codelist}" for codelist_vl_oid, codelist
+                               in zip(columns["codelist_vl_oid"], columns["codelist"])]
+    return columns
+
+
+def column_rows(columns):
+    """
+    Turns columns as returned by frame_columns into rows.
+    Args:
+        columns (dict): The values of each column as a list, keyed by column name.
+    Returns:
+        list[dict]: One plain dict per row, keyed by column name.
+    """
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
 def create_description(text, lang="en", type="text/plain"):
     description = ODM.Description()
     translatedText = ODM.TranslatedText(_content=text, Type=type, lang=lang)
@@ -106,7 +198,7 @@ def create_alias(context, name):
 
 def create_item_group_ref(row, type):
     item_group_ref = ODM.ItemGroupRef(
-        ItemGroupOID=create_oid(type.upper(), row),
+        ItemGroupOID=row[f"{type.lower()}_oid"],
         OrderNumber=row["bc_order_number"],
         Mandatory="Yes")
     return item_group_ref
@@ -117,7 +209,7 @@ def create_item_group_def(row, type, itemrefs=[]):
     item_group_def = None
     if type.upper() == "SECTION":
         item_group_def = ODM.ItemGroupDef(
-            OID=create_oid(type.upper(), row),
+            OID=row[f"{type.lower()}_oid"],
             Name=row["form_section_label"],
             Repeating=REPEATING_MAP[row["form_section_repeating"]],
             Type=type,
@@ -126,7 +218,7 @@ def create_item_group_def(row, type, itemrefs=[]):
         )
     if type.upper() == "CONCEPT":
         item_group_def = ODM.ItemGroupDef(
-            OID=create_oid(type.upper(), row),
+            OID=row[f"{type.lower()}_oid"],
             Name=row["short_name"],
             Repeating=REPEATING_MAP[row["bc_repeating"]],
             Type=type,
@@ -150,8 +242,25 @@ def create_item_group_def(row, type, itemrefs=[]):
     return item_group_def
 
 
+def create_concept_item_group_def(rows):
+    """
+    Creates the ItemGroupDef of a collection group, with an ItemRef to each item that is not hidden.
+    Args:
+        rows (list[dict]): The rows of one collection group in order, with the OID columns added by add_oid_columns.
+    Returns:
+        ODM.ItemGroupDef: The ItemGroupDef of the collection group.
+    """
+    row = rows[0]
+    logger.info(
+        f"{row['form_section_id']} - {row['form_section_label']} - "
+        f"{row['crf_group_id']} - {row['bc_id']}"
+    )
+    item_refs = [create_item_ref(item_row) for item_row in rows if item_row["display_hidden"] != "Y"]
+    return create_item_group_def(row, "Concept", itemrefs=item_refs)
+
+
 def create_item_ref(row):
-    item_ref = ODM.ItemRef(ItemOID=create_oid("ITEM", row),
+    item_ref = ODM.ItemRef(ItemOID=row["item_oid"],
                            OrderNumber=row["order_number"],
                            Mandatory=MANDATORY_MAP[row["mandatory_variable"]])
     if row["prepopulated_term"] != "":
@@ -159,13 +268,13 @@ def create_item_ref(row):
     # Check if there actually is an ORRESU variable to reference
     if row["variable_name"][-5:] == "ORRES" and row["variable_name_units"] != '':
         if row["variable_name_units"][-6:] == "ORRESU":
-            item_ref.UnitsItemOID = create_oid("ITEM", row).replace("ORRES", "ORRESU")
+            item_ref.UnitsItemOID = row["item_oid"].replace("ORRES", "ORRESU")
     return item_ref
 
 
 def create_item_def(row):
     item_def = ODM.ItemDef(
-        OID=create_oid("ITEM", row),
+        OID=row["item_oid"],
         Name=row["crf_item"],
         DataType=row["data_type"]
     )
@@ -178,9 +287,9 @@ def create_item_def(row):
     if row["prompt"] != "":
         item_def.Prompt = create_prompt((row["prompt"]))
     if row["codelist"] != "":
-        item_def.CodeListRef = ODM.CodeListRef(CodeListOID=create_oid("CODELIST", row))
+        item_def.CodeListRef = ODM.CodeListRef(CodeListOID=row["codelist_oid"])
     elif row["value_display_list"] != "":
-        item_def.CodeListRef = ODM.CodeListRef(CodeListOID=create_oid("CODELIST_VL", row))
+        item_def.CodeListRef = ODM.CodeListRef(CodeListOID=row["codelist_vl_oid"])
 
     alias_list = []
     if row["sdtm_annotation"] != "":
@@ -217,7 +326,7 @@ def create_decode(text, lang="en", type="text/plain"):
 
 
 def create_codelist(row):
-    codelist = ODM.CodeList(OID=create_oid("CODELIST", row),
+    codelist = ODM.CodeList(OID=row["codelist_oid"],
                             Name=row["codelist_submission_value"],
                             DataType=row["data_type"])
     codelist_items = []
@@ -234,23 +343,11 @@ def create_codelist(row):
                 f"display values for row: {row_context}"
             )
             sys.exit()
-        for item in codelist_item_value_list:
+        for item, display_value in zip(codelist_item_value_list, codelist_item_value_display_list):
             codelist_item = ODM.CodeListItem(CodedValue=item)
-            try:
-                display_index = codelist_item_value_list.index(item)
-                display_value = codelist_item_value_display_list[display_index]
-                decode = create_decode(display_value, lang="en", type="text/plain")
-            except IndexError:
-                logger.error(
-                    (
-                        f"No display value found for codelist item '{item}' in row: "
-                        f"{row.get('crf_group_id', '')} - {row.get('crf_item', '')}"
-                    )
-                )
-                sys.exit()
-            codelist_item.Decode = decode
+            codelist_item.Decode = create_decode(display_value, lang="en", type="text/plain")
             codelist_items.append(codelist_item)
-            codelist.CodeListItem = codelist_items
+        codelist.CodeListItem = codelist_items
     else:
         codelist_item = None
         if row["prepopulated_term"] != "":
@@ -284,11 +381,11 @@ def create_codelist(row):
 
 def create_codelist_from_valuelist(row):
     if row["vlm_group_id"] != "":
-        codelist = ODM.CodeList(OID=create_oid("CODELIST_VL", row),
+        codelist = ODM.CodeList(OID=row["codelist_vl_oid"],
                                 Name=row["vlm_group_id"] + "-" + row["variable_name"],
                                 DataType=row["data_type"])
     else:
-        codelist = ODM.CodeList(OID=create_oid("CODELIST_VL", row),
+        codelist = ODM.CodeList(OID=row["codelist_vl_oid"],
                                 Name=row["crf_group_id"] + "-" + row["variable_name"],
                                 DataType=row["data_type"])
     codelist_items = []
@@ -304,27 +401,11 @@ def create_codelist_from_valuelist(row):
                 f"Mismatch between number of codelist items and display values for row: {row_context}"
             )
             sys.exit()
-        for item in codelist_item_value_list:
+        for item, display_value in zip(codelist_item_value_list, codelist_item_value_display_list):
             codelist_item = ODM.CodeListItem(CodedValue=item)
-
-            try:
-                display_index = codelist_item_value_list.index(item)
-                display_value = codelist_item_value_display_list[display_index]
-                decode = create_decode(display_value, lang="en", type="text/plain")
-            except IndexError:
-                row_context = (
-                    f"{row.get('crf_group_id', '')} - "
-                    f"{row.get('crf_item', '')}"
-                )
-                logger.error(
-                    f"No display value found for codelist item '{item}' "
-                    f"in row: {row_context}"
-                )
-                sys.exit()
-            codelist_item.Decode = decode
-
+            codelist_item.Decode = create_decode(display_value, lang="en", type="text/plain")
             codelist_items.append(codelist_item)
-            codelist.CodeListItem = codelist_items
+        codelist.CodeListItem = codelist_items
     else:
         codelist_item = None
         if row["prepopulated_term"] != "":
@@ -353,6 +434,50 @@ def create_codelist_from_valuelist(row):
     return codelist
 
 
+def codelist_key(row):
+    """
+    Returns the content of the codelist of a row; rows with equal keys get the same CodeList.
+    The name is part of the content, as the annotated CRF shows it.
+    Args:
+        row (dict): A row with a codelist or value list.
+    Returns:
+        tuple: The codelist, name, data type, values, display values and prepopulated term of the row.
+    """
+    if row["codelist"] != "":
+        name = row["codelist_submission_value"]
+    elif row["vlm_group_id"] != "":
+        name = row["vlm_group_id"] + "-" + row["variable_name"]
+    else:
+        name = row["crf_group_id"] + "-" + row["variable_name"]
+    return (row["codelist"], name, row["data_type"], row["value_list"], row["value_display_list"],
+            row["prepopulated_term"], row["prepopulated_code"])
+
+
+def add_codelist(row, codelists):
+    """
+    Adds the CodeList of a row to codelists, unless an earlier row has a codelist with the same content.
+
+    The codelist_oid or codelist_vl_oid of the row is set to the OID of the shared CodeList, so the ItemDef
+    of the row refers to it.
+    Args:
+        row (dict): A row with a codelist or value list, with the OID columns added by add_oid_columns.
+        codelists (dict): The CodeLists created so far, keyed by codelist_key.
+    Returns:
+        ODM.CodeList: The CodeList of the row.
+    """
+    key = codelist_key(row)
+    codelist = codelists.get(key)
+    if row["codelist"] != "":
+        if codelist is None:
+            codelist = codelists[key] = create_codelist(row)
+        row["codelist_oid"] = codelist.OID
+    else:
+        if codelist is None:
+            codelist = codelists[key] = create_codelist_from_valuelist(row)
+        row["codelist_vl_oid"] = codelist.OID
+    return codelist
+
+
 def create_df_from_excel(crf_metadata, crf_metadata_sheet, forms_metadata, forms_metadata_sheet, crf_form_id):
     """
     Reads form and CRF metadata from Excel files, processes and merges the data,
@@ -371,19 +496,30 @@ def create_df_from_excel(crf_metadata, crf_metadata_sheet, forms_metadata, forms
     Side Effects:
         Prints the processed forms DataFrame and the first 100 rows of the merged DataFrame for inspection.
     """
+    df_crf, df_forms_bcs = read_metadata_excel(crf_metadata, crf_metadata_sheet, forms_metadata, forms_metadata_sheet)
+    return create_df_for_form(df_crf, df_forms_bcs, crf_form_id)
+
+
+def read_metadata_excel(crf_metadata, crf_metadata_sheet, forms_metadata, forms_metadata_sheet):
+    """
+    Reads the CRF and forms metadata workbooks once, for all forms.
+    Args:
+        crf_metadata (str): Path to the Excel file containing CRF metadata.
+        crf_metadata_sheet (str): Name of the Excel sheet containing CRF metadata.
+        forms_metadata (str): Path to the Excel file containing form metadata.
+        forms_metadata_sheet (str): Name of the Excel sheet containing form metadata.
+    Returns:
+        tuple:
+            - pd.DataFrame: CRF specializations of all forms.
+            - pd.DataFrame: Forms metadata of all forms.
+    """
     # Read forms from Excel
     logger.info(f"Reading form metadata from {forms_metadata} (sheet: {forms_metadata_sheet})")
     try:
-        forms_metadata_str = str(forms_metadata)
-        if forms_metadata_str.startswith("https"):
-            response = requests.get(forms_metadata_str)
-            response.raise_for_status()
-            excel_source = io.BytesIO(response.content)
-        else:
-            excel_source = open(forms_metadata, 'rb')
-        df_forms_bcs = pd.read_excel(
-            excel_source,
-            sheet_name=forms_metadata_sheet,
+        df_forms_bcs = read_excel_cached(
+            forms_metadata,
+            forms_metadata_sheet,
+            cache_dir=METADATA_CACHE_PATH,
             keep_default_na=False,
             engine='openpyxl'
         )
@@ -394,6 +530,43 @@ def create_df_from_excel(crf_metadata, crf_metadata_sheet, forms_metadata, forms
         logger.error(f"Error reading forms metadata ({forms_metadata}): {e}")
         sys.exit()
 
+    # Read Collection Specializations from Excel
+    logger.info(f"Reading CRF metadata from {crf_metadata} (sheet: {crf_metadata_sheet})")
+    try:
+        df_crf = read_metadata_table(
+            crf_metadata,
+            crf_metadata_sheet,
+            columns=CRF_METADATA_COLUMNS,
+            converters=CRF_METADATA_CONVERTERS,
+            cache_dir=METADATA_CACHE_PATH
+        )
+    except FileNotFoundError:
+        logger.error(f"CRF metadata file not found: {crf_metadata}")
+        sys.exit()
+    except requests.RequestException as e:
+        logger.error(f"Error fetching CRF metadata from URL ({crf_metadata}): {e}")
+        sys.exit()
+    except Exception as e:
+        logger.error(f"Error reading CRF metadata ({crf_metadata}): {e}")
+        sys.exit()
+
+    return df_crf, df_forms_bcs
+
+
+def create_df_for_form(df_crf, df_forms_bcs, crf_form_id):
+    """
+    Selects the metadata of one form from the metadata returned by read_metadata_excel and merges it.
+    Args:
+        df_crf (pd.DataFrame): CRF specializations of all forms.
+        df_forms_bcs (pd.DataFrame): Forms metadata of all forms.
+        crf_form_id (str): The identifier for the CRF to process.
+    Returns:
+        tuple:
+            - pd.DataFrame: Merged DataFrame containing CRF specializations and form metadata.
+            - pd.DataFrame: DataFrame containing unique forms with selected columns.
+            - str: Name of the form corresponding to the CRF.
+            - str: Annotation of the form corresponding to the CRF.
+    """
     df_forms_bcs = df_forms_bcs[df_forms_bcs['form_id'] == crf_form_id].reset_index(drop=True)
     if len(df_forms_bcs) == 0:
         logger.error(
@@ -419,34 +592,8 @@ def create_df_from_excel(crf_metadata, crf_metadata_sheet, forms_metadata, forms
     )]]
     df_forms.sort_values(['form_section_order_number'], ascending=[True], inplace=True)
 
-    # Read Collection Specializations from Excel
-    logger.info(f"Reading CRF metadata from {crf_metadata} (sheet: {crf_metadata_sheet})")
-    try:
-        crf_metadata_str = str(crf_metadata)
-        if crf_metadata_str.startswith("https"):
-            response = requests.get(crf_metadata_str)
-            response.raise_for_status()
-            excel_source = io.BytesIO(response.content)
-        else:
-            excel_source = open(crf_metadata, 'rb')
-        df = pd.read_excel(
-            excel_source,
-            sheet_name=crf_metadata_sheet,
-            keep_default_na=False,
-            engine='openpyxl'
-        )
-    except FileNotFoundError:
-        logger.error(f"CRF metadata file not found: {crf_metadata}")
-        sys.exit()
-    except requests.RequestException as e:
-        logger.error(f"Error fetching CRF metadata from URL ({crf_metadata}): {e}")
-        sys.exit()
-    except Exception as e:
-        logger.error(f"Error reading CRF metadata ({crf_metadata}): {e}")
-        sys.exit()
-
     # Merge CRF Specializations with forms
-    df = df.merge(
+    df = df_crf.merge(
         df_forms_bcs,
         how='inner',
         left_on='crf_group_id',
@@ -484,7 +631,7 @@ def create_df_from_excel(crf_metadata, crf_metadata_sheet, forms_metadata, forms
     return df, df_forms, form_name, form_annotation
 
 
-def create_odm(df, df_forms, crf_form_id, form_name, form_annotation):
+def create_odm(df, df_forms, crf_form_id, form_name, form_annotation, creation_datetime=None):
     """
     Creates an ODM (Operational Data Model) object from the provided dataframes and form information.
     This function constructs an ODM-compliant metadata structure using the input dataframes for forms and items,
@@ -497,6 +644,8 @@ def create_odm(df, df_forms, crf_form_id, form_name, form_annotation):
         crf_form_id (str): Identifier for the CRF to be used as the main form.
         form_name (str): Name of the form to be used in the ODM metadata.
         form_annotation (str): Annotation on the form to be used in the ODM metadata.
+        creation_datetime (str, optional): CreationDateTime of the ODM, for reproducible outputs; defaults to
+            the current date and time.
     Returns:
         odm (ODM.ODM): An ODM object populated with the study metadata, including forms, item groups,
             items, and codelists.
@@ -504,12 +653,16 @@ def create_odm(df, df_forms, crf_form_id, form_name, form_annotation):
         - Assumes the existence of helper functions such as `create_oid`, `create_description`, `create_item_ref`,
           `create_item_group_def`, `create_item_group_ref`, `create_item_def`, and `create_codelist`.
         - Relies on the ODM Python library (e.g., odmlib) for ODM element classes.
+        - The OIDs are added as columns by add_oid_columns, and the helpers get plain dict rows from column_rows.
+        - Rows with the same codelist content share one CodeList (see add_codelist).
         - The function prints CRF group transitions for debugging purposes.
     """
+    section_rows = column_rows(frame_columns(df_forms))
     item_group_refs = []
-    for i, row in df_forms.iterrows():
+    for row in section_rows:
+        row["section_oid"] = create_oid("SECTION", row)
         item_group_ref = ODM.ItemGroupRef(
-            ItemGroupOID=create_oid("SECTION", row),
+            ItemGroupOID=row["section_oid"],
             OrderNumber=row["form_section_order_number"],
             Mandatory="Yes")           # Add the FormDef to the list of forms
         item_group_refs.append(item_group_ref)
@@ -529,10 +682,10 @@ def create_odm(df, df_forms, crf_form_id, form_name, form_annotation):
         form.Alias = alias_list
 
     forms = {}
-    for i, row in df_forms.iterrows():
+    for row in section_rows:
         # Define a FormDef
         form_def = ODM.ItemGroupDef(
-            OID=create_oid("SECTION", row),
+            OID=row["section_oid"],
             Name=row["form_section_label"],
             Repeating=REPEATING_MAP[row["form_section_repeating"]],
             Type="Section",
@@ -542,53 +695,26 @@ def create_odm(df, df_forms, crf_form_id, form_name, form_annotation):
         # Add the FormDef to the list of forms
         forms[row["form_section_id"]] = form_def
 
-    item_group_refs = []
+    # Plain dict rows with precomputed OIDs; df is sorted by collection group, so groupby yields each group once
+    rows = column_rows(add_oid_columns(frame_columns(df)))
     item_group_defs = []
-    item_refs = []
-    item_defs = []
-    codelists = []
-    crf_group_id = ""
-    item_group_def = None
-    for i, row in df.iterrows():
-
-        if row["crf_group_id"] != crf_group_id:  # New Collection Group
-            logger.info(
-                f"{row['form_section_id']} - {row['form_section_label']} - "
-                f"{row['crf_group_id']} - {row['bc_id']}"
-            )
-
-            if crf_group_id:
-                item_group_defs.append(item_group_def)
-
-            crf_group_id = row["crf_group_id"]
-            item_refs = []
-
-            if row["display_hidden"] != "Y":
-                item_ref = create_item_ref(row)
-                item_refs.append(item_ref)
+    for _, group_rows in groupby(rows, key=itemgetter("crf_group_id")):  # New Collection Group
+        group_rows = list(group_rows)
+        item_group_ref = create_item_group_ref(group_rows[0], "Concept")
+        forms[group_rows[0]["form_section_id"]].ItemGroupRef.append(item_group_ref)
+        item_group_defs.append(create_concept_item_group_def(group_rows))
 
-            item_group_ref = create_item_group_ref(row, "Concept")
-            forms[row["form_section_id"]].ItemGroupRef.append(item_group_ref)
-
-            item_group_def = create_item_group_def(row, "Concept", itemrefs=item_refs)
-
-        else:
-            if row["display_hidden"] != "Y":
-                item_ref = create_item_ref(row)
-                item_refs.append(item_ref)
+    item_defs = []
+    codelists = {}
+    for row in rows:
+        if row["codelist"] != "" or row["value_display_list"] != "":
+            add_codelist(row, codelists)
 
         if row["display_hidden"] != "Y":
             item_def = create_item_def(row)
             item_defs.append(item_def)
 
-        if row["codelist"] != "":
-            codelist = create_codelist(row)
-            codelists.append(codelist)
-        elif row["value_display_list"] != "":
-            codelist = create_codelist_from_valuelist(row)
-            codelists.append(codelist)
-
-    for i, row in df_forms.iterrows():
+    for row in section_rows:
         alias_list = []
         if row["form_section_annotation"] != "":
             form_alias = create_alias("formSectionAnnotation", row["form_section_annotation"])
@@ -598,10 +724,8 @@ def create_odm(df, df_forms, crf_form_id, form_name, form_annotation):
             alias_list.append(form_alias)
         forms[row["form_section_id"]].Alias = alias_list
 
-    item_group_defs.append(item_group_def)
-
     # Create a new ODM object
-    current_datetime = datetime.datetime.now(datetime.UTC).isoformat()
+    current_datetime = creation_datetime or datetime.datetime.now(datetime.UTC).isoformat()
     odm = ODM.ODM(
         FileOID=create_oid("ODM", []),
         Granularity="Metadata",
@@ -630,7 +754,7 @@ def create_odm(df, df_forms, crf_form_id, form_name, form_annotation):
         mdv[0].ItemGroupDef.append(item_group_def)
     for item_def in item_defs:
         mdv[0].ItemDef.append(item_def)
-    for codelist in codelists:
+    for codelist in codelists.values():
         mdv[0].CodeList.append(codelist)
 
     study = ODM.Study(
@@ -657,6 +781,455 @@ def update_crf_metadata(update_crf_metadata):
     return
 
 
+def create_artifacts_in_memory(odm, odm_xml_file, odm_json_file, html_file, html_file_annotated,
+                               schema_file, xsl_file, zip_file, reload_odm=True, creation_datetime=None):
+    """
+    Serializes the ODM once and creates all artifacts from the in-memory XML instead of re-reading the written files.
+
+    The XML bytes are written to disk, validated against the ODM 2.0 schema, transformed to the CRF and
+    annotated CRF HTML, and added to the zip file, without parsing any of the output files again.
+    Args:
+        odm: The ODM object to serialize.
+        odm_xml_file (Path): The path of the ODM XML file to write.
+        odm_json_file (Path): The path of the ODM JSON file to write.
+        html_file (Path): The path of the CRF HTML file to write.
+        html_file_annotated (Path): The path of the annotated CRF HTML file to write.
+        schema_file (Path): The path of the ODM 2.0 XML schema.
+        xsl_file (Path): The path of the XSL stylesheet that renders the CRF.
+        zip_file (Path): The path of the zip file to update with all artifacts in one write.
+        reload_odm (bool): Load the XML bytes again with the odmlib loader as a final check.
+        creation_datetime (str, optional): The fixed CreationDateTime of the ODM, also used as the time of the
+            zip entries.
+    Returns:
+        None
+    """
+    xml_buffer = io.BytesIO()
+    odm.write_xml(xml_buffer, streaming=True)
+    odm_xml = xml_buffer.getvalue()
+    odm_json = odm.to_json().encode("utf-8")
+    odm_xml_file.write_bytes(odm_xml)
+    odm_json_file.write_bytes(odm_json)
+
+    try:
+        validate_odm_xml_bytes(odm_xml, schema_file, cache_dir=__config.schema_cache_path,
+                               backend=__config.schema_backend)
+    except Exception as e:
+        logger.error(f"ODM XML validation failed for {odm_xml_file}: {e}")
+        sys.exit()
+
+    transformer = get_saxon_transformer()
+    crf_html, acrf_html = transformer.transform_crf(transformer.parse(xml_bytes=odm_xml), xsl_file,
+                                                    html_file, html_file_annotated)
+
+    if reload_odm:
+        loader = LO.ODMLoader(OL.XMLODMLoader(model_package="odm_2_0", ns_uri="http://www.cdisc.org/ns/odm/v2.0"))
+        loader.load_odm_string(odm_xml)
+
+    write_zip_entries(zip_file, {
+        odm_xml_file.name: odm_xml,
+        odm_json_file.name: odm_json,
+        html_file.name: crf_html.encode("utf-8"),
+        html_file_annotated.name: acrf_html.encode("utf-8")
+    }, date_time=zip_date_time(creation_datetime))
+
+
+def serialize_odm(df, df_forms, crf_form_id, form_name, form_annotation, creation_datetime=None):
+    """
+    Creates the ODM of a form and returns it serialized as XML and JSON.
+    Args:
+        df (pd.DataFrame): Merged CRF metadata of the form, as returned by create_df_for_form.
+        df_forms (pd.DataFrame): Sections of the form, as returned by create_df_for_form.
+        crf_form_id (str): The identifier of the CRF.
+        form_name (str): Name of the form.
+        form_annotation (str): Annotation of the form.
+        creation_datetime (str, optional): A fixed CreationDateTime.
+    Returns:
+        tuple: The UTF-8 encoded ODM XML and ODM JSON.
+    """
+    odm = create_odm(df, df_forms, crf_form_id, form_name, form_annotation, creation_datetime)
+    xml_buffer = io.BytesIO()
+    odm.write_xml(xml_buffer, streaming=True)
+    return xml_buffer.getvalue(), odm.to_json().encode("utf-8")
+
+
+def reload_odm_xml(odm_xml):
+    """
+    Loads ODM XML bytes with the odmlib loader as a final check of the generated ODM.
+    Returns:
+        bool: True, as the ODM could be loaded.
+    """
+    loader = LO.ODMLoader(OL.XMLODMLoader(model_package="odm_2_0", ns_uri="http://www.cdisc.org/ns/odm/v2.0"))
+    loader.load_odm_string(odm_xml)
+    return True
+
+
+def package_crf(zip_file, artifact_files, creation_datetime, odm_xml, odm_json, crf_html, acrf_html, *checks):
+    """
+    Writes the artifacts of a form into its zip file.
+    Args:
+        zip_file (Path): The path of the zip file.
+        artifact_files (tuple): The paths of the ODM XML, ODM JSON, CRF HTML and annotated CRF HTML files,
+            whose names are used for the zip entries.
+        creation_datetime (str, optional): The fixed CreationDateTime, used as the time of the zip entries.
+        odm_xml (bytes): The ODM XML.
+        odm_json (bytes): The ODM JSON.
+        crf_html (str): The CRF HTML.
+        acrf_html (str): The annotated CRF HTML.
+        *checks: The results of the checks that must pass before the form is packaged; not used otherwise.
+    Returns:
+        None
+    """
+    contents = (odm_xml, odm_json, crf_html.encode("utf-8"), acrf_html.encode("utf-8"))
+    write_zip_entries(zip_file, {artifact.name: content for artifact, content in zip(artifact_files, contents)},
+                      date_time=zip_date_time(creation_datetime))
+
+
+def create_crf_pipeline(reload_odm=True):
+    """
+    Declares the steps of generate_crf as the stages of a pipeline (see utilities.pipeline).
+
+    The ODM is created and serialized first. Writing the XML and JSON files, the schema validation, the two
+    XSL transformations and the reload check then run at the same time, and the zip file is written once the
+    checks passed. When the stage_cache setting is configured, the outputs of the ODM, validation, transformation
+    and reload stages are cached by the content of their inputs, the ODM 2.0 schema, the generator source files
+    and the odmlib version, and are reused while these do not change. The files are always written. Without a
+    fixed CreationDateTime, a reused ODM keeps the CreationDateTime of the run that created it.
+    Args:
+        reload_odm (bool): Include the reload check.
+    Returns:
+        Pipeline: The pipeline; run it with the inputs listed in run_crf_pipeline.
+    """
+    checks = ("odm_valid", "odm_reloaded") if reload_odm else ("odm_valid",)
+    stages = [
+        Stage("odm", serialize_odm,
+              inputs=("df", "df_forms", "crf_form_id", "form_name", "form_annotation", "creation_datetime"),
+              outputs=("odm_xml", "odm_json")),
+        Stage("write_xml", Path.write_bytes, inputs=("odm_xml_file", "odm_xml"), cache=False),
+        Stage("write_json", Path.write_bytes, inputs=("odm_json_file", "odm_json"), cache=False),
+        Stage("validate", partial(validate_odm_xml_bytes, cache_dir=__config.schema_cache_path,
+                                  backend=__config.schema_backend),
+              inputs=("odm_xml", "schema_file"), outputs=("odm_valid",)),
+        Stage("crf_html", partial(transform_xml_bytes_saxonche, displayAnnotations=0),
+              inputs=("odm_xml", "xsl_file"), outputs=("crf_html",)),
+        Stage("acrf_html", partial(transform_xml_bytes_saxonche, displayAnnotations=1),
+              inputs=("odm_xml", "xsl_file"), outputs=("acrf_html",)),
+        Stage("write_crf_html", partial(Path.write_text, encoding="utf-8"), inputs=("html_file", "crf_html"),
+              cache=False),
+        Stage("write_acrf_html", partial(Path.write_text, encoding="utf-8"),
+              inputs=("html_file_annotated", "acrf_html"), cache=False),
+        Stage("package", package_crf,
+              inputs=("zip_file", "artifact_files", "creation_datetime", "odm_xml", "odm_json", "crf_html",
+                      "acrf_html", *checks),
+              cache=False),
+    ]
+    if reload_odm:
+        stages.append(Stage("reload", reload_odm_xml, inputs=("odm_xml",), outputs=("odm_reloaded",)))
+    schema_files = sorted(ODM_XML_SCHEMA_FILE.parent.glob("*.xsd"))
+    return Pipeline(stages, cache_dir=__config.stage_cache_path, max_workers=4,
+                    salt=content_hash(*schema_files, *GENERATOR_FILES, odmlib.__version__))
+
+
+def run_crf_pipeline(df, df_forms, crf_form_id, form_name, form_annotation, file_name_prefix=None, reload_odm=True,
+                     creation_datetime=None):
+    """
+    Generates the artifacts of one form with the pipeline of create_crf_pipeline.
+
+    The arguments are those of generate_crf.
+    Returns:
+        None
+    """
+    artifact_files = form_artifact_files(crf_form_id, file_name_prefix)
+    odm_xml_file, odm_json_file, html_file, html_file_annotated, zip_file = artifact_files
+    create_crf_pipeline(reload_odm).run(
+        df=df, df_forms=df_forms, crf_form_id=crf_form_id, form_name=form_name, form_annotation=form_annotation,
+        creation_datetime=creation_datetime, odm_xml_file=odm_xml_file, odm_json_file=odm_json_file,
+        html_file=html_file, html_file_annotated=html_file_annotated, zip_file=zip_file,
+        artifact_files=artifact_files[:4], schema_file=ODM_XML_SCHEMA_FILE, xsl_file=XSL_FILE
+    )
+
+
+def form_artifact_files(crf_form_id, file_name_prefix=None):
+    """
+    Returns the paths of the artifacts generate_crf creates for a form.
+    Args:
+        crf_form_id (str): The identifier of the CRF.
+        file_name_prefix (str, optional): The prefix of the output filenames; defaults to the lowercase CRF ID.
+    Returns:
+        tuple: The ODM XML, ODM JSON, CRF HTML, annotated CRF HTML and zip file paths.
+    """
+    if file_name_prefix is None:
+        file_name_prefix = crf_form_id.lower().replace(" ", "_")
+    else:
+        file_name_prefix = file_name_prefix.lower().replace(" ", "_")
+
+    form_path = Path(CRF_PATH).joinpath(f"{crf_form_id}")
+    return (
+        form_path.joinpath(f"{file_name_prefix}_odmv2-0.xml"),
+        form_path.joinpath(f"{file_name_prefix}_odmv2-0.json"),
+        form_path.joinpath(f"{file_name_prefix}_odmv2-0_crf.html"),
+        form_path.joinpath(f"{file_name_prefix}_odmv2-0_acrf.html"),
+        form_path.joinpath(f"{file_name_prefix}_odm.zip")
+    )
+
+
+def zip_date_time(creation_datetime):
+    """
+    Returns the time of the zip entries for a fixed CreationDateTime, or None to use the current time.
+    """
+    if creation_datetime is None:
+        return None
+    return datetime.datetime.fromisoformat(creation_datetime).timetuple()[:6]
+
+
+def form_input_hash(partition, file_name_prefix=None, creation_datetime=None):
+    """
+    Returns a hash of everything the artifacts of a form are generated from.
+
+    The hash covers the metadata of the form, the XSL stylesheet, the files of the ODM 2.0 schema,
+    the generator source files, the odmlib version, the output filename prefix and the CreationDateTime.
+    Args:
+        partition (tuple): (crf_form_id, df, df_forms, form_name, form_annotation), as returned by
+            partition_metadata.
+        file_name_prefix (str, optional): The prefix of the output filenames.
+        creation_datetime (str, optional): The fixed CreationDateTime, if any.
+    Returns:
+        str: The hex digest of the inputs.
+    """
+    schema_files = sorted(ODM_XML_SCHEMA_FILE.parent.glob("*.xsd"))
+    return content_hash(*partition, file_name_prefix, creation_datetime, XSL_FILE, *schema_files,
+                        *GENERATOR_FILES, odmlib.__version__)
+
+
+def changed_forms(partitions, manifest, file_name_prefix=None, creation_datetime=None):
+    """
+    Selects the forms whose inputs changed since their artifacts were generated, or whose artifacts are missing.
+    Args:
+        partitions (list): (crf_form_id, df, df_forms, form_name, form_annotation) for each CRF, as returned by
+            partition_metadata.
+        manifest (dict): The build manifest, as returned by read_build_manifest.
+        file_name_prefix (str, optional): The prefix of the output filenames.
+        creation_datetime (str, optional): The fixed CreationDateTime, if any.
+    Returns:
+        tuple:
+            - list: The partitions of the forms to generate.
+            - dict: The input hash of each form to generate, keyed by CRF identifier.
+    """
+    changed = []
+    input_hashes = {}
+    for partition in partitions:
+        crf_form_id = partition[0]
+        input_hash = form_input_hash(partition, file_name_prefix, creation_datetime)
+        entry = manifest.get(crf_form_id, {})
+        if entry.get("hash") == input_hash and all(Path(f).exists() for f in entry.get("artifacts", [])):
+            logger.info(f"CRF {crf_form_id} is unchanged; skipping it")
+            continue
+        changed.append(partition)
+        input_hashes[crf_form_id] = input_hash
+    return changed, input_hashes
+
+
+def record_generated_forms(manifest, input_hashes, crf_form_ids, file_name_prefix=None):
+    """
+    Records the input hash and artifacts of generated forms in the build manifest and writes it.
+    Args:
+        manifest (dict): The build manifest, as returned by read_build_manifest.
+        input_hashes (dict): The input hash of each form, as returned by changed_forms.
+        crf_form_ids (list): The identifiers of the CRFs that were generated.
+        file_name_prefix (str, optional): The prefix of the output filenames.
+    Returns:
+        None
+    """
+    for crf_form_id in crf_form_ids:
+        manifest[crf_form_id] = {
+            "hash": input_hashes[crf_form_id],
+            "artifacts": [str(f) for f in form_artifact_files(crf_form_id, file_name_prefix)]
+        }
+    write_build_manifest(MANIFEST_FILE, manifest)
+
+
+def generate_crf(df, df_forms, crf_form_id, form_name, form_annotation, file_name_prefix=None, in_memory=False,
+                 reload_odm=True, creation_datetime=None, pipeline=False):
+    """
+    Generates the ODM 2.0 XML and JSON, the CRF and annotated CRF HTML, and the zip file of one form.
+    Args:
+        df (pd.DataFrame): Merged CRF metadata of the form, as returned by create_df_for_form.
+        df_forms (pd.DataFrame): Sections of the form, as returned by create_df_for_form.
+        crf_form_id (str): The identifier for the CRF to process.
+        form_name (str): Name of the form.
+        form_annotation (str): Annotation of the form.
+        file_name_prefix (str, optional): The prefix to use for the output filenames; defaults to the lowercase CRF ID.
+        in_memory (bool): Create the artifacts from the in-memory XML (see create_artifacts_in_memory).
+        reload_odm (bool): Load the generated ODM XML again with the odmlib loader as a final check.
+        creation_datetime (str, optional): A fixed CreationDateTime, for reproducible outputs.
+        pipeline (bool): Create the artifacts with the staged pipeline (see create_crf_pipeline); in_memory is
+            then ignored.
+    Returns:
+        str: The identifier of the processed CRF.
+    """
+    ODM_XML_FILE, ODM_JSON_FILE, ODM_HTML_FILE_XSL, ODM_HTML_FILE_XSL_ANNOTATED, ZIP_FILE = form_artifact_files(
+        crf_form_id, file_name_prefix
+    )
+
+    create_directory(Path(CRF_PATH).joinpath(f"{crf_form_id}"))
+
+    if pipeline:
+        run_crf_pipeline(df, df_forms, crf_form_id, form_name, form_annotation, file_name_prefix, reload_odm,
+                         creation_datetime)
+        return crf_form_id
+
+    odm = create_odm(df, df_forms, crf_form_id, form_name, form_annotation, creation_datetime)
+
+    if in_memory:
+        create_artifacts_in_memory(odm, ODM_XML_FILE, ODM_JSON_FILE, ODM_HTML_FILE_XSL, ODM_HTML_FILE_XSL_ANNOTATED,
+                                   ODM_XML_SCHEMA_FILE, XSL_FILE, ZIP_FILE, reload_odm, creation_datetime)
+        return crf_form_id
+
+    odm.write_xml(odm_file=ODM_XML_FILE)
+    odm.write_json(odm_file=ODM_JSON_FILE)
+
+    try:
+        validate_odm_xml_file(ODM_XML_FILE, ODM_XML_SCHEMA_FILE, verbose=False,
+                              cache_dir=__config.schema_cache_path, backend=__config.schema_backend)
+    except Exception as e:
+        logger.error(f"ODM XML validation failed for {ODM_XML_FILE}: {e}")
+        sys.exit()
+
+    transformer = get_saxon_transformer()
+    transformer.transform_crf(transformer.parse(xml_path=ODM_XML_FILE), XSL_FILE,
+                              ODM_HTML_FILE_XSL, ODM_HTML_FILE_XSL_ANNOTATED)
+
+    if reload_odm:
+        loader = LO.ODMLoader(OL.XMLODMLoader(model_package="odm_2_0", ns_uri="http://www.cdisc.org/ns/odm/v2.0"))
+        loader.open_odm_document(ODM_XML_FILE)
+        odm = loader.load_odm()
+
+    write_zip_entries(ZIP_FILE, {
+        artifact.name: artifact
+        for artifact in (ODM_XML_FILE, ODM_JSON_FILE, ODM_HTML_FILE_XSL, ODM_HTML_FILE_XSL_ANNOTATED)
+    }, date_time=zip_date_time(creation_datetime))
+
+    return crf_form_id
+
+
+def partition_metadata(df_crf, df_forms_bcs, crf_form_ids):
+    """
+    Partitions the metadata read by read_metadata_excel by form_id.
+    Args:
+        df_crf (pd.DataFrame): CRF specializations of all forms.
+        df_forms_bcs (pd.DataFrame): Forms metadata of all forms.
+        crf_form_ids (list): The identifiers of the CRFs to process.
+    Returns:
+        tuple:
+            - list: (crf_form_id, df, df_forms, form_name, form_annotation) for each CRF with metadata.
+            - list: The identifiers of the CRFs without metadata.
+    """
+    available_form_ids = set(df_forms_bcs['form_id'])
+    partitions = []
+    failed = []
+    for crf_form_id in crf_form_ids:
+        if crf_form_id not in available_form_ids:
+            logger.error(f"No data found in the forms metadata for the specified CRF ({crf_form_id}).")
+            failed.append(crf_form_id)
+            continue
+        try:
+            partitions.append((crf_form_id, *create_df_for_form(df_crf, df_forms_bcs, crf_form_id)))
+        except SystemExit:
+            # create_df_for_form exits when a form has no metadata; skip that form in a batch
+            failed.append(crf_form_id)
+    return partitions, failed
+
+
+def generate_crfs(df_crf, df_forms_bcs, crf_form_ids=None, jobs=None, in_memory=False, reload_odm=True,
+                  incremental=False, creation_datetime=None, pipeline=False):
+    """
+    Generates the artifacts of several forms from metadata that was read once, one form per worker process.
+
+    The metadata is partitioned by form_id in this process, and each worker receives only the
+    metadata of its form. A form that fails is logged and does not stop the other forms.
+    Args:
+        df_crf (pd.DataFrame): CRF specializations of all forms, as returned by read_metadata_excel.
+        df_forms_bcs (pd.DataFrame): Forms metadata of all forms, as returned by read_metadata_excel.
+        crf_form_ids (list, optional): The identifiers of the CRFs to process; all forms when None.
+        jobs (int, optional): Number of worker processes; defaults to the number of CPUs. With 1, the
+            forms are processed one after another in this process.
+        in_memory (bool): Create the artifacts from the in-memory XML (see create_artifacts_in_memory).
+        reload_odm (bool): Load the generated ODM XML again with the odmlib loader as a final check.
+        incremental (bool): Skip the forms whose inputs did not change since they were generated, and record
+            the generated forms in the build manifest (see changed_forms).
+        creation_datetime (str, optional): A fixed CreationDateTime, for reproducible outputs.
+        pipeline (bool): Create the artifacts with the staged pipeline (see create_crf_pipeline).
+    Returns:
+        list: The identifiers of the CRFs that could not be generated.
+    """
+    if crf_form_ids is None:
+        crf_form_ids = list(dict.fromkeys(df_forms_bcs['form_id']))
+    partitions, failed = partition_metadata(df_crf, df_forms_bcs, crf_form_ids)
+    if incremental:
+        manifest = read_build_manifest(MANIFEST_FILE)
+        partitions, input_hashes = changed_forms(partitions, manifest, creation_datetime=creation_datetime)
+
+    form_args = {
+        crf_form_id: (df, df_forms, crf_form_id, form_name, form_annotation, None, in_memory, reload_odm,
+                      creation_datetime, pipeline)
+        for crf_form_id, df, df_forms, form_name, form_annotation in partitions
+    }
+    generation_failed = run_generate_crf(form_args, jobs)
+    failed.extend(generation_failed)
+
+    generated = [crf_form_id for crf_form_id in form_args if crf_form_id not in generation_failed]
+    if incremental:
+        record_generated_forms(manifest, input_hashes, generated)
+    unchanged = len(crf_form_ids) - len(failed) - len(generated)
+    logger.info(f"Generated {len(generated)} of {len(crf_form_ids)} CRFs"
+                + (f", {unchanged} unchanged" if unchanged else ""))
+    return failed
+
+
+def run_generate_crf(form_args, jobs=None):
+    """
+    Runs generate_crf for several forms, one form per worker process.
+    Args:
+        form_args (dict): The generate_crf arguments of each form, keyed by CRF identifier.
+        jobs (int, optional): Number of worker processes; defaults to the number of CPUs. With 1, the
+            forms are processed one after another in this process.
+    Returns:
+        list: The identifiers of the CRFs that could not be generated.
+    """
+    failed = []
+    if jobs == 1:
+        for crf_form_id, args in form_args.items():
+            try:
+                generate_crf(*args)
+            except (Exception, SystemExit) as e:
+                logger.error(f"CRF generation failed for {crf_form_id}: {e}")
+                failed.append(crf_form_id)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(generate_crf, *args): crf_form_id for crf_form_id, args in form_args.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except (Exception, SystemExit) as e:
+                    logger.error(f"CRF generation failed for {futures[future]}: {e}")
+                    failed.append(futures[future])
+    return failed
+
+
+def validate_creation_datetime(ctx, param, value):
+    """
+    Checks the --creation-datetime option and returns it in ISO 8601 format.
+    """
+    if value is None:
+        return None
+    try:
+        creation_datetime = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise click.BadParameter("expected an ISO 8601 date and time, e.g. 2025-01-01T00:00:00+00:00")
+    if creation_datetime.year < 1980:
+        raise click.BadParameter("zip files cannot store dates before 1980")
+    return creation_datetime.isoformat()
+
+
 @click.command(help="Generate ODM v2.0 eCRFs and their HTML renditions")
 @click.option(
     "--update-crf-metatadata",
@@ -701,10 +1274,27 @@ def update_crf_metadata(update_crf_metadata):
 @click.option(
     "--form",
     "-f",
-    "crf_form_id",
+    "crf_form_ids",
+    required=False,
+    multiple=True,
+    help="The ID of the CRF to process. Repeat the option to process several CRFs in one run."
+)
+@click.option(
+    "--all-forms",
+    "-a",
+    "all_forms",
+    is_flag=True,
+    required=False,
+    help="Process all CRFs in the forms metadata."
+)
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=int,
     required=False,
     default=None,
-    help="The ID of the CRF to process."
+    help="Number of worker processes when several CRFs are processed. Defaults to the number of CPUs."
 )
 @click.option(
     "--prefix",
@@ -716,14 +1306,69 @@ def update_crf_metadata(update_crf_metadata):
         "When not specified, the lowercase CRF ID will be used."
     )
 )
+@click.option(
+    "--in-memory",
+    "-m",
+    "in_memory",
+    is_flag=True,
+    required=False,
+    help=(
+        "Serialize the ODM once and validate, transform and zip it from memory "
+        "instead of re-reading the written files."
+    )
+)
+@click.option(
+    "--incremental",
+    "-i",
+    "incremental",
+    is_flag=True,
+    required=False,
+    help=(
+        "Skip the CRFs whose metadata, stylesheet, schema and generator did not change since they were generated "
+        "in incremental mode, as recorded in the build manifest."
+    )
+)
+@click.option(
+    "--creation-datetime",
+    "-t",
+    "creation_datetime",
+    required=False,
+    callback=validate_creation_datetime,
+    help="A fixed CreationDateTime (ISO 8601) for the ODM files and zip entries, for reproducible outputs."
+)
+@click.option(
+    "--pipeline",
+    "-s",
+    "pipeline",
+    is_flag=True,
+    required=False,
+    help=(
+        "Run the generation steps as pipeline stages, running independent steps at the same time and reusing the "
+        "cached outputs of unchanged steps when the stage_cache setting is configured."
+    )
+)
+@click.option(
+    "--reload/--no-reload",
+    "reload_odm",
+    default=True,
+    show_default=True,
+    help="Load the generated ODM XML again with the odmlib loader as a final check."
+)
 def main(
     update_crf_metadata: bool,
     crf_metadata_path: str,
     crf_metadata_sheet: str,
     form_metadata_path: str,
     form_metadata_sheet: str,
-    crf_form_id: str,
+    crf_form_ids: tuple,
+    all_forms: bool,
+    jobs: int,
     file_name_prefix: str,
+    in_memory: bool,
+    incremental: bool,
+    creation_datetime: str,
+    reload_odm: bool,
+    pipeline: bool,
 ):
     """
     Main function to generate, validate, and transform an ODM 2.0 XML file from Excel metadata.
@@ -743,8 +1388,16 @@ def main(
         crf_metadata_sheet (str): The name of the Excel sheet containing crf metadata.
         form_metadata_path (str): The path to the Excel file containing form metadata.
         form_metadata_sheet (str): The name of the Excel sheet containing form metadata.
-        crf_form_id (str): The identifier for the CRF to process.
-        file_name_prefix (str): The prefix to use for the output filenames.
+        crf_form_ids (tuple): The identifiers for the CRFs to process.
+        all_forms (bool): Process all CRFs in the forms metadata.
+        jobs (int): Number of worker processes when several CRFs are processed.
+        file_name_prefix (str): The prefix to use for the output filenames; only used for a single CRF.
+        in_memory (bool): Serialize the ODM to XML bytes once and use them for validation, the XSL
+            transformations and the zip file, instead of re-reading the files written to disk.
+        incremental (bool): Skip the CRFs whose inputs did not change since they were generated.
+        creation_datetime (str): A fixed CreationDateTime for the ODM files, for reproducible outputs.
+        reload_odm (bool): Load the generated ODM XML again with the odmlib loader as a final check.
+        pipeline (bool): Run the generation steps as cached, concurrent pipeline stages (see create_crf_pipeline).
     Returns:
         None
     """
@@ -760,57 +1413,32 @@ def main(
         logger.info(f"Saved CRF metadata ({CRF_SPECIALIZATIONS_METADATA_EXCEL_REMOTE}) to {save_path}")
         exit()
 
-    if crf_form_id is None:
-        logger.error("CRF form ID must be specified using the --form option.")
+    if not crf_form_ids and not all_forms:
+        logger.error("CRF form ID must be specified using the --form or --all-forms option.")
         exit()
 
-    if file_name_prefix is None:
-        file_name_prefix = crf_form_id.lower().replace(" ", "_")
-    else:
-        file_name_prefix = file_name_prefix.lower().replace(" ", "_")
-
-    ODM_XML_SCHEMA_FILE = Path(__config.odm20_schema)
-    XSL_FILE = Path(__config.odm20_stylesheet)
-    ODM_XML_FILE = Path(CRF_PATH).joinpath(f"{crf_form_id}", f"{file_name_prefix}_odmv2-0.xml")
-    ODM_JSON_FILE = Path(CRF_PATH).joinpath(f"{crf_form_id}", f"{file_name_prefix}_odmv2-0.json")
-    ODM_HTML_FILE_XSL = Path(CRF_PATH).joinpath(f"{crf_form_id}", f"{file_name_prefix}_odmv2-0_crf.html")
-    ODM_HTML_FILE_XSL_ANNOTATED = Path(CRF_PATH).joinpath(
-        f"{crf_form_id}", f"{file_name_prefix}_odmv2-0_acrf.html"
-    )
-
-    df, df_forms, form_name, form_annotation = create_df_from_excel(
-        crf_metadata_path,
-        crf_metadata_sheet,
-        form_metadata_path,
-        form_metadata_sheet,
-        crf_form_id
-    )
-
-    odm = create_odm(df, df_forms, crf_form_id, form_name, form_annotation)
-
-    create_directory(Path(CRF_PATH).joinpath(f"{crf_form_id}"))
-
-    odm.write_xml(odm_file=ODM_XML_FILE)
-    odm.write_json(odm_file=ODM_JSON_FILE)
-
-    try:
-        validate_odm_xml_file(ODM_XML_FILE, ODM_XML_SCHEMA_FILE, verbose=False)
-    except Exception as e:
-        logger.error(f"ODM XML validation failed for {ODM_XML_FILE}: {e}")
-        sys.exit()
-
-    transform_xml_saxonche(ODM_XML_FILE, XSL_FILE, ODM_HTML_FILE_XSL, displayAnnotations=0)
-    transform_xml_saxonche(ODM_XML_FILE, XSL_FILE, ODM_HTML_FILE_XSL_ANNOTATED)
-
-    loader = LO.ODMLoader(OL.XMLODMLoader(model_package="odm_2_0", ns_uri="http://www.cdisc.org/ns/odm/v2.0"))
-    loader.open_odm_document(ODM_XML_FILE)
-    odm = loader.load_odm()
-
-    ZIP_FILE = Path(CRF_PATH).joinpath(f"{crf_form_id}", f"{file_name_prefix}_odm.zip")
-    update_zip_file(ZIP_FILE, ODM_XML_FILE.name, ODM_XML_FILE)
-    update_zip_file(ZIP_FILE, ODM_JSON_FILE.name, ODM_JSON_FILE)
-    update_zip_file(ZIP_FILE, ODM_HTML_FILE_XSL.name, ODM_HTML_FILE_XSL)
-    update_zip_file(ZIP_FILE, ODM_HTML_FILE_XSL_ANNOTATED.name, ODM_HTML_FILE_XSL_ANNOTATED)
+    df_crf, df_forms_bcs = read_metadata_excel(crf_metadata_path, crf_metadata_sheet,
+                                               form_metadata_path, form_metadata_sheet)
+
+    if all_forms or len(crf_form_ids) > 1:
+        if file_name_prefix is not None:
+            logger.warning("The --prefix option is ignored when more than one CRF is processed.")
+        generate_crfs(df_crf, df_forms_bcs, None if all_forms else list(crf_form_ids), jobs, in_memory, reload_odm,
+                      incremental, creation_datetime, pipeline)
+        return
+
+    crf_form_id = crf_form_ids[0]
+    df, df_forms, form_name, form_annotation = create_df_for_form(df_crf, df_forms_bcs, crf_form_id)
+    if incremental:
+        manifest = read_build_manifest(MANIFEST_FILE)
+        partition = (crf_form_id, df, df_forms, form_name, form_annotation)
+        changed, input_hashes = changed_forms([partition], manifest, file_name_prefix, creation_datetime)
+        if not changed:
+            return
+    generate_crf(df, df_forms, crf_form_id, form_name, form_annotation, file_name_prefix, in_memory, reload_odm,
+                 creation_datetime, pipeline)
+    if incremental:
+        record_generated_forms(manifest, input_hashes, [crf_form_id], file_name_prefix)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+"""
+Benchmark for XMLODMLoader.load_document: per-descriptor find/findall queries
+versus single-pass tag dispatch, with and without trusted mode, on synthetic
+ODM v1.3.2 metadata documents with thousands of ItemDefs.
+"""
+import sys
+from pathlib import Path
+
+# Add top-level folder to path so that odmlib can be found
+SCRIPT_DIR = Path.cwd()
+sys.path.append(str(SCRIPT_DIR))
+
+import statistics
+import time
+import click
+
+from odmlib import odm_loader as OL
+
+ODM_NS = "http://www.cdisc.org/ns/odm/v1.3"
+
+
+class FindAllXMLODMLoader(OL.XMLODMLoader):
+    """XMLODMLoader that loads children with one namespace query per declared child descriptor."""
+
+    def load_document(self, elem, *args):
+        elem_name = elem.tag[elem.tag.find('}') + 1:]
+        elem_class = getattr(self.ODM, elem_name)
+        if elem.text and not elem.text.isspace():
+            attrib = {**elem.attrib, **{"_content": elem.text}}
+            odm_obj = elem_class(**attrib)
+        else:
+            odm_obj = elem_class(**elem.attrib)
+        for k, v in elem_class.__dict__.items():
+            if type(v).__name__ == "ODMObject":
+                namespace = self.nsr.get_ns_entry_dict(v.namespace)
+                e = elem.find(v.namespace + ":" + k, namespace)
+                if e is not None:
+                    setattr(odm_obj, k, self.load_document(e))
+            elif type(v).__name__ == "ODMListObject":
+                namespace = self.nsr.get_ns_entry_dict(v.namespace)
+                for e in elem.findall(v.namespace + ":" + k, namespace):
+                    getattr(odm_obj, k).append(self.load_document(e))
+        return odm_obj
+
+
+def create_odm_string(item_count):
+    """Return an ODM v1.3.2 metadata document with ``item_count`` ItemDefs in one ItemGroupDef."""
+    item_refs = []
+    item_defs = []
+    for i in range(item_count):
+        item_refs.append(f'<ItemRef ItemOID="IT.{i}" Mandatory="No" OrderNumber="{i + 1}"/>')
+        item_defs.append(
+            f'<ItemDef OID="IT.{i}" Name="ITEM{i}" DataType="text" Length="20">'
+            f'<Question><TranslatedText xml:lang="en">Question {i}</TranslatedText></Question>'
+            f'<CodeListRef CodeListOID="CL.NY"/>'
+            f'<Alias Context="CDASH" Name="ITEM{i}"/>'
+            f'</ItemDef>'
+        )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<ODM xmlns="{ODM_NS}" FileOID="ODM.BENCH" FileType="Snapshot" Granularity="Metadata" '
+        f'CreationDateTime="2025-01-01T00:00:00" ODMVersion="1.3.2">'
+        f'<Study OID="ST.BENCH">'
+        f'<GlobalVariables><StudyName>Bench</StudyName><StudyDescription>Bench</StudyDescription>'
+        f'<ProtocolName>Bench</ProtocolName></GlobalVariables>'
+        f'<MetaDataVersion OID="MDV.BENCH" Name="Bench">'
+        f'<ItemGroupDef OID="IG.BENCH" Name="Bench" Repeating="No">{"".join(item_refs)}</ItemGroupDef>'
+        f'{"".join(item_defs)}'
+        f'<CodeList OID="CL.NY" Name="NY" DataType="text">'
+        f'<EnumeratedItem CodedValue="Y"/><EnumeratedItem CodedValue="N"/></CodeList>'
+        f'</MetaDataVersion></Study></ODM>'
+    )
+
+
+def time_load(loader_class, odm_string, repeat, **kwargs):
+    """Return the median wall time in seconds of loading ``odm_string`` with ``loader_class``."""
+    loader = loader_class(model_package="odm_1_3_2", **kwargs)
+    loader.create_document_from_string(odm_string)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader.load_odm()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@click.command(help="Benchmark XMLODMLoader child loading on documents with thousands of ItemDefs")
+@click.option(
+    "--items",
+    "-n",
+    "item_counts",
+    multiple=True,
+    type=int,
+    default=[1000, 2000, 4000, 8000],
+    show_default=True,
+    help="Number of ItemDefs in a generated document (repeatable)."
+)
+@click.option(
+    "--repeat",
+    "-r",
+    "repeat",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Number of timed loads per document; the median is reported."
+)
+def main(item_counts, repeat):
+    print(f"{'ItemDefs':>10} {'find/findall (s)':>18} {'tag dispatch (s)':>18} {'speedup':>8} "
+          f"{'trusted (s)':>12} {'speedup':>8}")
+    for item_count in item_counts:
+        odm_string = create_odm_string(item_count)
+        legacy = time_load(FindAllXMLODMLoader, odm_string, repeat)
+        dispatch = time_load(OL.XMLODMLoader, odm_string, repeat)
+        trusted = time_load(OL.XMLODMLoader, odm_string, repeat, trusted=True)
+        print(f"{item_count:>10} {legacy:>18.3f} {dispatch:>18.3f} {legacy / dispatch:>7.2f}x "
+              f"{trusted:>12.3f} {legacy / trusted:>7.2f}x")
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark for the memory held per odmlib element with the default per-instance __dict__ storage
+versus the compact slot-backed classes from odmlib.odm_element.compact_model.
+"""
+import sys
+from pathlib import Path
+
+# Add top-level folder to path so that odmlib can be found
+SCRIPT_DIR = Path.cwd()
+sys.path.append(str(SCRIPT_DIR))
+
+import gc
+import tracemalloc
+import click
+
+import odmlib.odm_1_3_2.model as ODM
+from odmlib import odm_element as OE
+
+
+def create_item_data(model, count):
+    """Return ``count`` ItemData objects as found in ClinicalData."""
+    return [model.ItemData(ItemOID=f"IT.VS.VSORRES.{i}", Value=str(i)) for i in range(count)]
+
+
+def create_item_defs(model, count):
+    """Return ``count`` ItemDef objects with a Question, a CodeListRef and an Alias."""
+    item_defs = []
+    for i in range(count):
+        item = model.ItemDef(OID=f"IT.{i}", Name=f"ITEM{i}", DataType="text", Length=20)
+        item.Question = model.Question(TranslatedText=[model.TranslatedText(_content=f"Question {i}", lang="en")])
+        item.CodeListRef = model.CodeListRef(CodeListOID="CL.NY")
+        item.Alias.append(model.Alias(Context="CDASH", Name=f"ITEM{i}"))
+        item_defs.append(item)
+    return item_defs
+
+
+def measure(create, model, count):
+    """Return the number of bytes allocated and still held per object created by ``create``."""
+    gc.collect()
+    tracemalloc.start()
+    objects = create(model, count)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return held / count
+
+
+@click.command(help="Measure the memory held per odmlib element with __dict__ and compact slot storage")
+@click.option(
+    "--count",
+    "-n",
+    "count",
+    type=int,
+    default=100000,
+    show_default=True,
+    help="Number of objects created per measurement."
+)
+def main(count):
+    compact = OE.compact_model(ODM)
+    print(f"{'element':>10} {'__dict__ (B)':>14} {'compact (B)':>13} {'ratio':>7}")
+    for name, create in (("ItemData", create_item_data), ("ItemDef", create_item_defs)):
+        default = measure(create, ODM, count)
+        slots = measure(create, compact, count)
+        print(f"{name:>10} {default:>14.0f} {slots:>13.0f} {default / slots:>6.2f}x")
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark for ODMElement.validate: separate order, OID and conformance walks versus the single-pass
+ValidationVisitor, on synthetic ODM v1.3.2 metadata documents with thousands of ItemDefs.
+"""
+import sys
+from pathlib import Path
+
+# Add top-level folder to path so that odmlib can be found
+SCRIPT_DIR = Path.cwd()
+sys.path.append(str(SCRIPT_DIR))
+sys.path.append(str(Path(__file__).parent))
+
+import statistics
+import time
+import click
+
+from odmlib import odm_loader as OL
+from odmlib import oid_generator as OG
+from odmlib.odm_1_3_2.rules import metadata_schema as METADATA
+from bench_loader import create_odm_string
+
+
+def time_validate(odm, repeat, single_pass):
+    """Return the median wall time in seconds of a full collect_errors validation of ``odm``."""
+    conformance_checker = METADATA.MetadataSchema()
+    timings = []
+    for _ in range(repeat):
+        oid_checker = OG.create_oid_checker("odm_1_3_2")
+        start = time.perf_counter()
+        errors = odm.validate(collect_errors=True, oid_checker=oid_checker,
+                              conformance_checker=conformance_checker, single_pass=single_pass)
+        timings.append(time.perf_counter() - start)
+        if errors:
+            raise errors[0]
+    return statistics.median(timings)
+
+
+@click.command(help="Benchmark ODMElement.validate on documents with thousands of ItemDefs")
+@click.option(
+    "--items",
+    "-n",
+    "item_counts",
+    multiple=True,
+    type=int,
+    default=[1000, 4000],
+    show_default=True,
+    help="Number of ItemDefs in a generated document (repeatable)."
+)
+@click.option(
+    "--repeat",
+    "-r",
+    "repeat",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Number of timed validations per document; the median is reported."
+)
+def main(item_counts, repeat):
+    print(f"{'ItemDefs':>10} {'separate walks (s)':>20} {'single pass (s)':>17} {'speedup':>8}")
+    for item_count in item_counts:
+        loader = OL.XMLODMLoader(model_package="odm_1_3_2")
+        loader.create_document_from_string(create_odm_string(item_count))
+        odm = loader.load_odm()
+        separate = time_validate(odm, repeat, single_pass=False)
+        single = time_validate(odm, repeat, single_pass=True)
+        print(f"{item_count:>10} {separate:>20.3f} {single:>17.3f} {separate / single:>7.2f}x")
+
+
+if __name__ == "__main__":
+
+    main()
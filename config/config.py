@@ -21,6 +21,18 @@ class AppSettings:
         config_file = self._get_config_file()
         config.read(config_file)
         self.crf_path = config.get('CRF', 'crf_path')
+        self.schema_cache_path = None
+        self.metadata_cache_path = None
+        self.stage_cache_path = None
+        self.schema_backend = 'xmlschema'
+
+        self._load_section_options(
+            config,
+            'CRF',
+            {
+                'stage_cache': 'stage_cache_path',
+            }
+        )
 
         self._load_section_options(
             config,
@@ -32,6 +44,7 @@ class AppSettings:
                 'crf_specializations_metadata_excel_sheet': 'crf_specializations_metadata_excel_sheet',
                 'forms_metadata_excel': 'forms_metadata_excel',
                 'forms_metadata_excel_sheet': 'forms_metadata_excel_sheet',
+                'metadata_cache': 'metadata_cache_path',
             }
         )
         self._load_section_options(
@@ -40,6 +53,8 @@ class AppSettings:
             {
                 'odm132_xml': 'odm132_schema',
                 'odm20_xml': 'odm20_schema',
+                'schema_cache': 'schema_cache_path',
+                'schema_backend': 'schema_backend',
             }
         )
         self._load_section_options(
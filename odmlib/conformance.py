@@ -0,0 +1,228 @@
+"""Conformance checking generated from odmlib model descriptors.
+
+:class:`ModelConformanceChecker` checks odmlib objects against the rules
+declared by the descriptors of their model classes, so it covers every
+model package (``odm_1_3_2``, ``odm_2_0``, compact models, extensions)
+without a hand-written schema. The objects are checked directly: there is
+no :meth:`~odmlib.odm_element.ODMElement.to_dict` copy of the tree and no
+cerberus interpretation.
+
+The rules for a class are compiled once, on first use, from its
+descriptors:
+
+- ``required=True`` attributes and child elements must be present, and a
+  required :class:`~odmlib.typed.ODMListObject` must hold at least one element
+- :class:`~odmlib.typed.Typed`, :class:`~odmlib.typed.Integer` and
+  :class:`~odmlib.typed.Float` values must have the declared type
+- :class:`~odmlib.typed.PositiveInteger` and the other ``Positive`` and
+  ``NonNegative`` descriptors bound the value
+- ``Sized`` and ``Regex`` descriptors check length and pattern, and format
+  descriptors use the check registered in :data:`~odmlib.typed.FORMAT_CHECKS`
+- :class:`~odmlib.typed.ValueSetString` and the other ``ValidValues``
+  descriptors test membership in the valueset bound to the class
+- child elements must be instances of the descriptor's element class
+- names that no descriptor declares are reported as unknown
+
+The checks repeat those the descriptors run on assignment, which matters for
+objects built in permissive mode or loaded with ``trusted=True``::
+
+    checker = ModelConformanceChecker()
+    odm.verify_conformance(checker)
+    errors = odm.validate(collect_errors=True, conformance_checker=checker, single_pass=True)
+
+Errors are reported as :exc:`~odmlib.exceptions.OdmlibConformanceError` with
+a cerberus-style ``{name: [message]}`` dict in ``cerberus_errors``.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Callable, Tuple
+import odmlib.descriptor as DESC
+import odmlib.typed as T
+import odmlib.visitor as VIS
+from odmlib.exceptions import OdmlibConformanceError
+
+
+def _type_check(odm_type: type, type_name: str) -> Tuple[Callable[[Any], bool], str]:
+    return (lambda value: isinstance(value, odm_type)), f"must be of {type_name} type"
+
+
+def _value_checks(descriptor: Any, owner: type) -> list:
+    """Return the ``(check, message)`` pairs for a non-element descriptor, type check first."""
+    return [*_type_checks(descriptor), *_range_checks(descriptor), *_pattern_checks(descriptor),
+            *_allowed_value_checks(descriptor, owner)]
+
+
+def _type_checks(descriptor: Any) -> list:
+    """Return the type check of a descriptor, if it has one."""
+    if isinstance(descriptor, T.Integer):
+        return [_type_check(int, "integer")]
+    if isinstance(descriptor, T.Float):
+        return [_type_check(float, "float")]
+    if isinstance(descriptor, T.Typed) and descriptor.odm_type is not object:
+        return [_type_check(descriptor.odm_type, descriptor.odm_type.__name__)]
+    return []
+
+
+def _range_checks(descriptor: Any) -> list:
+    """Return the minimum value and maximum length checks of a descriptor."""
+    checks = []
+    if isinstance(descriptor, T.Positive):
+        checks.append(((lambda value: value > 0), "min value is 1" if isinstance(descriptor, T.Integer)
+                       else "must be greater than 0"))
+    elif isinstance(descriptor, T.NonNegative):
+        checks.append(((lambda value: value >= 0), "min value is 0"))
+    if isinstance(descriptor, T.Sized):
+        max_length = descriptor.max_length
+        checks.append(((lambda value: len(value) <= max_length), f"max length is {max_length}"))
+    return checks
+
+
+def _pattern_checks(descriptor: Any) -> list:
+    """Return the regular expression and format checks of a descriptor."""
+    checks = []
+    if isinstance(descriptor, T.Regex):
+        checks.append((descriptor.pat.match, "value does not match regex"))
+    format_check = next((T.FORMAT_CHECKS[cls] for cls in type(descriptor).__mro__ if cls in T.FORMAT_CHECKS), None)
+    if format_check is not None:
+        checks.append((format_check, f"value does not match the {type(descriptor).__name__} format"))
+    return checks
+
+
+def _allowed_value_checks(descriptor: Any, owner: type) -> list:
+    """Return the value set check of a descriptor, if it has one."""
+    if isinstance(descriptor, T.ValidValues):
+        _, index = descriptor._bound.get(owner) or descriptor.bind(owner)
+        return [(index.__contains__, "unallowed value {value!r}")]
+    if isinstance(descriptor, T.ExtendedValidValues):
+        valid_values = frozenset(descriptor.valid_values)
+        return [(valid_values.__contains__, "unallowed value {value!r}")]
+    return []
+
+
+def _element_checks(descriptor: Any) -> list:
+    """Return the ``(check, message)`` pairs for an ODMObject or ODMListObject descriptor."""
+    obj_type = descriptor.obj_type
+    type_name = obj_type.__name__
+    if not isinstance(descriptor, T.ODMListObject):
+        return [_type_check(obj_type, type_name)]
+    checks = [((lambda value: isinstance(value, list) and all(isinstance(obj, obj_type) for obj in value)),
+               f"must be a list of {type_name}")]
+    if descriptor.required:
+        checks.append((len, "min length is 1"))
+    return checks
+
+
+@lru_cache(maxsize=None)
+def conformance_rules(elem_class: type) -> Tuple[tuple, frozenset]:
+    """Return the conformance rules for an odmlib model class, compiled from its descriptors.
+
+    Descriptors declared on base classes are included; a descriptor declared
+    again in a subclass replaces the inherited one.
+
+    Args:
+        elem_class (type): The odmlib model class.
+
+    Returns:
+        tuple: ``(rules, names)`` where ``rules`` holds one
+        ``(name, required, checks)`` entry per declared attribute and child
+        element, in declaration order, ``checks`` being ``(check, message)``
+        pairs whose message may refer to ``{value}``, and ``names`` is the set
+        of declared names.
+    """
+    descriptors = {}
+    for klass in reversed(elem_class.__mro__):
+        for name, descriptor in {**klass.__dict__.get("_attrs", {}), **klass.__dict__.get("_elems", {})}.items():
+            if isinstance(descriptor, DESC.Descriptor):
+                descriptors[name] = descriptor
+    rules = []
+    for name, descriptor in descriptors.items():
+        if isinstance(descriptor, T.ODMObject):
+            checks = _element_checks(descriptor)
+        else:
+            checks = _value_checks(descriptor, elem_class)
+        rules.append((name, descriptor.required, tuple(checks)))
+    return tuple(rules), frozenset(descriptors)
+
+
+def element_errors(odm_obj: Any) -> dict:
+    """Return the conformance errors of a single element, without descending into its children.
+
+    Args:
+        odm_obj: An odmlib element.
+
+    Returns:
+        dict: ``{name: [message]}`` for each nonconforming attribute or child
+        element; empty if the element conforms.
+    """
+    rules, names = conformance_rules(type(odm_obj))
+    values = odm_obj.__dict__
+    errors = {}
+    for name, required, checks in rules:
+        value = values.get(name)
+        if value is None:
+            if required:
+                errors[name] = ["required field"]
+            continue
+        for check, message in checks:
+            try:
+                valid = check(value)
+            except (TypeError, ValueError):
+                valid = False
+            if not valid:
+                errors[name] = [message.format(value=value)]
+                break
+    for name in values:
+        if name not in names and name not in VIS._INTERNAL_NAMES:
+            errors[name] = ["unknown field"]
+    return errors
+
+
+class ModelConformanceChecker:
+    """Checks odmlib objects against the rules declared by their model descriptors.
+
+    Can be passed as ``conformance_checker`` to
+    :meth:`~odmlib.odm_element.ODMElement.validate` or as the validator to
+    :meth:`~odmlib.odm_element.ODMElement.verify_conformance` for any model
+    package. Rules are compiled once per model class and shared by all
+    instances (see :func:`conformance_rules`).
+    """
+
+    def check_element(self, odm_obj: Any) -> bool:
+        """Check a single element, without descending into its children.
+
+        Args:
+            odm_obj: An odmlib element.
+
+        Returns:
+            bool: True if the element conforms.
+
+        Raises:
+            OdmlibConformanceError: Listing every nonconforming attribute and
+                child element of ``odm_obj``.
+        """
+        errors = element_errors(odm_obj)
+        if errors:
+            element_type = type(odm_obj).__name__
+            raise OdmlibConformanceError(
+                f"Conformance validation failed for {element_type}: {errors}",
+                cerberus_errors=errors,
+                element_type=element_type,
+                hint="Review the cerberus_errors attribute for a field-by-field breakdown",
+            )
+        return True
+
+    def check_object_conformance(self, odm_obj: Any) -> bool:
+        """Check an element and all of its descendants in one walk.
+
+        Args:
+            odm_obj: The odmlib element at which to start, e.g. the ODM root.
+
+        Returns:
+            bool: True if every element conforms.
+
+        Raises:
+            OdmlibConformanceError: For the first nonconforming element, in
+                :func:`~odmlib.visitor.walk` order.
+        """
+        VIS.walk(odm_obj, VIS.ConformanceVisitor(self))
+        return True
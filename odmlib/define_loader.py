@@ -55,13 +55,15 @@ class XMLDefineLoader(DL.DocumentLoader):
             ns_uri = _DEFAULT_DEF_NS_URI.get(model_package, "http://www.cdisc.org/ns/def/v2.0")
         self.ns_uri = ns_uri
         self.nsr = NS.NamespaceRegistry()
+        self._child_tables = DL.ChildTagTables(self.nsr)
 
     def load_document(self, elem: ET.Element, *args: Any) -> Any:
         """Recursively load an XML element into an odmlib object tree.
 
         Strips the namespace URI from the tag name, instantiates the
         matching odmlib class from the Define-XML model package, and
-        recurses into child elements.
+        recurses into child elements. The children of ``elem`` are
+        scanned once and dispatched by qualified tag.
 
         Args:
             elem (ET.Element): The XML element to load.
@@ -77,19 +79,7 @@ class XMLDefineLoader(DL.DocumentLoader):
             odm_obj = elem_class(**attrib)
         else:
             odm_obj = elem_class(**elem.attrib)
-        odm_obj_dict = elem_class.__dict__.items()
-        for k, v in odm_obj_dict:
-            if type(v).__name__ == "ODMObject":
-                namespace = self.nsr.get_ns_entry_dict(v.namespace)
-                e = elem.find(v.namespace + ":" + k, namespace)
-                if e is not None:
-                    odm_child_obj = self.load_document(e)
-                    setattr(odm_obj, k, odm_child_obj)
-            elif type(v).__name__ == "ODMListObject":
-                namespace = self.nsr.get_ns_entry_dict(v.namespace)
-                for e in elem.findall(v.namespace + ":" + k, namespace):
-                    odm_child_obj = self.load_document(e)
-                    getattr(odm_obj, k).append(odm_child_obj)
+        DL.load_xml_children(odm_obj, elem, self._child_tables.get(elem_class), self.load_document)
         return odm_obj
 
     def create_document(self, filename: str, namespace_registry: Optional[Any] = None) -> ET.Element:
@@ -139,6 +129,7 @@ class XMLDefineLoader(DL.DocumentLoader):
         else:
             NS.NamespaceRegistry(prefix="odm", uri="http://www.cdisc.org/ns/odm/v1.3", is_default=True)
             self.nsr = NS.NamespaceRegistry(prefix="def", uri=self.ns_uri)
+        self._child_tables = DL.ChildTagTables(self.nsr)
 
     def load_odm(self) -> Any:
         """Return the root ODM object loaded from the stored document.
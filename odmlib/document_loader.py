@@ -10,8 +10,201 @@ Defines the interface that all concrete loaders
 
 Loaders are not typically used directly; pass an instance to
 :class:`~odmlib.loader.ODMLoader` for a unified facade.
+
+The XML loaders share :func:`build_child_tag_table`, which maps the qualified
+ElementTree tag of every child element declared on a model class to the
+descriptor that holds it, so an element's children can be dispatched in a
+single pass by :func:`load_xml_children` instead of one ``find``/``findall``
+query per declared child. :class:`ChildTagTables` caches the tables of a
+namespace registry and rebuilds them when the registry changes.
+
+For input that has already passed schema validation, the ODM loaders offer a
+trusted mode built on :func:`create_trusted_object`: attribute values are
+written straight into the new object with only integer and float coercion,
+bypassing the typed descriptors' format, value set and required checks.
 """
 from abc import ABC, abstractmethod
+from functools import lru_cache
+import odmlib.typed as T
+from odmlib.exceptions import OdmlibNamespaceError
+
+
+def build_child_tag_table(elem_class, nsr):
+    """Return the child-element dispatch table for an odmlib model class.
+
+    Keys are qualified ElementTree tags (``{uri}LocalName``) built from each
+    ODMObject/ODMListObject descriptor declared in ``elem_class`` and the URI
+    registered for the descriptor's namespace prefix. Values are
+    ``(attribute_name, is_list)`` tuples. Entries are inserted in declaration
+    order so callers can assign children in model order.
+
+    Args:
+        elem_class (type): The odmlib model class.
+        nsr (NamespaceRegistry): Registry used to resolve namespace prefixes.
+
+    Returns:
+        dict: ``{qualified_tag: (attribute_name, is_list)}``.
+
+    Raises:
+        OdmlibNamespaceError: If the namespace prefix of a child element is
+            not registered in ``nsr``.
+    """
+    table = {}
+    for k, v in elem_class.__dict__.items():
+        descriptor_type = type(v).__name__
+        if descriptor_type not in ("ODMObject", "ODMListObject"):
+            continue
+        uri = nsr.namespaces.get(v.namespace)
+        if uri is None:
+            raise OdmlibNamespaceError(
+                f"Namespace prefix '{v.namespace}' of {elem_class.__name__}.{k} is not registered",
+                hint=f"Register the prefix before loading, e.g. NamespaceRegistry(prefix='{v.namespace}', uri=...)",
+            )
+        table["{" + uri + "}" + k] = (k, descriptor_type == "ODMListObject")
+    return table
+
+
+class ChildTagTables:
+    """Cache of :func:`build_child_tag_table` results for one namespace registry.
+
+    The tables hold namespace URIs, and :class:`~odmlib.ns_registry.NamespaceRegistry`
+    shares its state across all instances, so the cached tables are dropped
+    whenever the registered namespaces differ from those they were built with.
+
+    Args:
+        nsr (NamespaceRegistry): Registry used to resolve namespace prefixes.
+    """
+
+    def __init__(self, nsr):
+        self.nsr = nsr
+        self._namespaces = dict(nsr.namespaces)
+        self._tables = {}
+
+    def get(self, elem_class):
+        """Return the child-element dispatch table for ``elem_class``, building it on first use.
+
+        Args:
+            elem_class (type): The odmlib model class being loaded.
+
+        Returns:
+            dict: ``{qualified_tag: (attribute_name, is_list)}``.
+        """
+        if self.nsr.namespaces != self._namespaces:
+            self._namespaces = dict(self.nsr.namespaces)
+            self._tables = {}
+        table = self._tables.get(elem_class)
+        if table is None:
+            table = build_child_tag_table(elem_class, self.nsr)
+            self._tables[elem_class] = table
+        return table
+
+
+def load_xml_children(odm_obj, elem, child_table, load_document, trusted=False):
+    """Load the child elements of ``elem`` into ``odm_obj`` in a single pass.
+
+    The children are dispatched by qualified tag, then assigned in model
+    declaration order, as one ``find``/``findall`` query per declared child
+    would assign them. Children that the model does not declare are ignored.
+
+    Args:
+        odm_obj: The odmlib object created for ``elem``.
+        elem (ET.Element): The XML element whose children are loaded.
+        child_table (dict): The dispatch table of ``odm_obj``'s class, from
+            :meth:`ChildTagTables.get`.
+        load_document (callable): Loads one child element, e.g. the loader's
+            ``load_document`` method.
+        trusted (bool): Store single children directly in the instance,
+            bypassing the descriptors, as :func:`create_trusted_object` does.
+    """
+    found = {}
+    for e in elem:
+        entry = child_table.get(e.tag)
+        if entry is not None:
+            found.setdefault(entry[0], []).append(e)
+    for k, is_list in child_table.values():
+        if k not in found:
+            continue
+        if is_list:
+            child_list = getattr(odm_obj, k)
+            for e in found[k]:
+                child_list.append(load_document(e))
+        elif trusted:
+            odm_obj.__dict__[k] = load_document(found[k][0])
+        else:
+            setattr(odm_obj, k, load_document(found[k][0]))
+
+
+def _coerce_int(value):
+    """Convert an XML/JSON string to int as :class:`~odmlib.typed.Integer` does, leaving invalid strings as-is."""
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _coerce_float(value):
+    """Convert a string or int to float as :class:`~odmlib.typed.Float` does, leaving invalid strings as-is."""
+    if isinstance(value, (str, int)):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+@lru_cache(maxsize=None)
+def trusted_attr_table(elem_class):
+    """Return the attribute coercion table used to load ``elem_class`` in trusted mode.
+
+    Args:
+        elem_class (type): The odmlib model class.
+
+    Returns:
+        dict: ``{attribute_name: coerce}`` for every declared attribute, where
+        ``coerce`` converts the value for Integer and Float descriptors and is
+        ``None`` for all others.
+    """
+    table = {}
+    for k, v in elem_class._attrs.items():
+        if isinstance(v, T.Integer):
+            table[k] = _coerce_int
+        elif isinstance(v, T.Float):
+            table[k] = _coerce_float
+        else:
+            table[k] = None
+    return table
+
+
+def create_trusted_object(elem_class, attrib):
+    """Instantiate ``elem_class`` from trusted attribute values without descriptor validation.
+
+    Values are stored directly in the instance, after integer and float
+    coercion. Namespace-qualified keys (``{uri}lang``) are reduced to the
+    local name as the constructor does. Undeclared attributes still go through
+    normal assignment, so they are rejected unless the validation mode skips
+    type checks. Required attributes are not checked.
+
+    Args:
+        elem_class (type): The odmlib model class to instantiate.
+        attrib (dict): Attribute names and values, e.g. ``elem.attrib``.
+
+    Returns:
+        An instance of ``elem_class``.
+    """
+    coercers = trusted_attr_table(elem_class)
+    odm_obj = elem_class.__new__(elem_class)
+    values = odm_obj.__dict__
+    for name, value in attrib.items():
+        if name not in coercers and "}" in name:
+            name = name[name.find('}') + 1:]
+        if name not in coercers:
+            setattr(odm_obj, name, value)
+            continue
+        coerce = coercers[name]
+        values[name] = value if coerce is None else coerce(value)
+    return odm_obj
 
 
 class DocumentLoader(ABC):
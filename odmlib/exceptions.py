@@ -90,10 +90,11 @@ class OdmlibSchemaValidationError(OdmlibValidationError):
     validation (e.g. by :meth:`ODMSchemaValidator.validate_file`). The
     wrapped exception is available at ``args[0]`` (for backward
     compatibility with callers that introspect ``ex.args[0].msg``) and
-    via the ``wrapped`` attribute.
+    via the ``wrapped`` attribute. ``line`` is the line number of the
+    failing element in the validated document, when it is known.
     """
 
-    def __init__(self, wrapped_exception, *, hint=None):
+    def __init__(self, wrapped_exception, *, hint=None, line=None):
         # Bypass OdmlibValidationError.__init__: it would replace args[0]
         # with a formatted string and would crash on a non-string message.
         # Preserve args[0] == wrapped exception for backward compatibility.
@@ -103,6 +104,7 @@ class OdmlibSchemaValidationError(OdmlibValidationError):
         self.attribute = None
         self.element_type = None
         self.actual_value = None
+        self.line = line if line is not None else getattr(wrapped_exception, "sourceline", None)
         self._raw_message = str(wrapped_exception)
         Exception.__init__(self, wrapped_exception)
 
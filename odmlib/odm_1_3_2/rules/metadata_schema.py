@@ -10,11 +10,39 @@ class ConformanceChecker(ABC):
             "Attempted to execute an abstract method validate_tree in the Validator class")
 
 
+# rules that make cerberus change the document in its normalization phase
+_NORMALIZATION_RULES = frozenset(("coerce", "default", "default_setter", "rename", "rename_handler",
+                                  "purge_unknown", "purge_readonly"))
+
+
+def _has_normalization_rules(schema):
+    """ return True if any rule in the schema or its nested schemas normalizes the document """
+    if isinstance(schema, dict):
+        return any(key in _NORMALIZATION_RULES or _has_normalization_rules(rule) for key, rule in schema.items())
+    if isinstance(schema, (list, tuple)):
+        return any(_has_normalization_rules(rule) for rule in schema)
+    return False
+
+
 class MetadataSchema(ConformanceChecker):
-    def __init__(self):
-        self._set_metadata_registry()
+    # schema name -> schema object this class added to the global cerberus registry; the schemas are added again
+    # when one of them has been removed or replaced in the registry since
+    _registered = {}
+    # schema name -> (schema, validator, normalize), shared by all instances
+    _validators = {}
+    # id(schema) -> (schema, shallow validator, child schemas) for single-pass validation
+    _element_validators = {}
 
-    def check_conformance(self, doc, schema_name):
+    def __init__(self):
+        registered = MetadataSchema._registered
+        if not registered or any(schema_registry.get(name) is not schema for name, schema in registered.items()):
+            previous = dict(schema_registry.all())
+            self._set_metadata_registry()
+            MetadataSchema._registered = {name: schema for name, schema in schema_registry.all().items()
+                                          if previous.get(name) is not schema}
+
+    def element_schema(self, schema_name):
+        """ return the registered schema used to check the root element of a single-pass validation """
         schema = schema_registry.get(schema_name)
         if schema is None:
             raise OdmlibConformanceError(
@@ -23,8 +51,70 @@ class MetadataSchema(ConformanceChecker):
                 hint=f"Register a schema for '{schema_name}' in MetadataSchema._set_metadata_registry(), "
                      "or call validate() without conformance_checker for this model.",
             )
-        v = validator.Validator(schema)
-        is_valid = v.validate(doc)
+        return schema
+
+    def check_element_conformance(self, doc, schema, schema_name):
+        """
+        check one element against its schema without descending into child elements
+
+        The rules for child elements are reduced to their type, required and length constraints, so ``doc`` holds
+        the element's attributes plus an empty dict per child element (or a list of them). Child elements are
+        checked against the schemas returned by this method when they are visited in turn.
+
+        :param doc: shallow dictionary for the element
+        :param schema: cerberus schema for the element, as registered or nested in the parent schema
+        :param schema_name: element name used in the error message
+        :return: dict mapping each child element name to its schema, or None if the schema does not describe it
+        """
+        # entries keep a reference to their schema so that its id cannot be reused while cached
+        entry = self._element_validators.get(id(schema))
+        if entry is None:
+            entry = self._element_validators[id(schema)] = (schema, *self._build_element_validator(schema))
+        _, v, child_schemas = entry
+        # the registered schemas have no normalization rules (coerce, default, rename, ...), so skip that phase
+        if not v.validate(doc, normalize=False):
+            raise OdmlibConformanceError(
+                f"Conformance validation failed for {schema_name}: {v.errors}",
+                cerberus_errors=v.errors,
+                element_type=schema_name,
+                hint="Review the cerberus_errors attribute for a field-by-field breakdown",
+            )
+        return child_schemas
+
+    @staticmethod
+    def _build_element_validator(schema):
+        shallow_schema = {}
+        child_schemas = {}
+        for field, rule in schema.items():
+            if "schema" not in rule:
+                shallow_schema[field] = rule
+                continue
+            shallow_schema[field] = {key: val for key, val in rule.items() if key != "schema"}
+            if rule.get("type") == "list":
+                child_schemas[field] = rule["schema"].get("schema")
+            else:
+                child_schemas[field] = rule["schema"]
+        return validator.Validator(shallow_schema), child_schemas
+
+    def conformance_validator(self, schema_name):
+        """
+        return the cerberus validator for a registered schema, compiled on first use and reused afterwards
+
+        The validator is rebuilt if a different schema has since been registered under the same name.
+
+        :param schema_name: name of the schema in the cerberus schema registry
+        :return: tuple of the validator and whether documents must be normalized before they are validated
+        """
+        schema = self.element_schema(schema_name)
+        entry = MetadataSchema._validators.get(schema_name)
+        if entry is None or entry[0] is not schema:
+            entry = MetadataSchema._validators[schema_name] = (
+                schema, validator.Validator(schema), _has_normalization_rules(schema))
+        return entry[1], entry[2]
+
+    def check_conformance(self, doc, schema_name):
+        v, normalize = self.conformance_validator(schema_name)
+        is_valid = v.validate(doc, normalize=normalize)
         if not is_valid:
             raise OdmlibConformanceError(
                 f"Conformance validation failed for {schema_name}: {v.errors}",
@@ -34,6 +124,17 @@ class MetadataSchema(ConformanceChecker):
             )
         return is_valid
 
+    def check_conformance_batch(self, docs, schema_name):
+        """
+        check a list of element dictionaries against the same schema with a single validator
+
+        :param docs: iterable of dictionaries, e.g. the to_dict() output of each ItemDef in a MetaDataVersion
+        :param schema_name: name of the schema in the cerberus schema registry
+        :return: list of (position, cerberus errors) tuples for the dictionaries that do not conform; empty if all do
+        """
+        v, normalize = self.conformance_validator(schema_name)
+        return [(i, v.errors) for i, doc in enumerate(docs) if not v.validate(doc, normalize=normalize)]
+
     @staticmethod
     def _set_metadata_registry():
         """ a cerberus json schema has been generated from the odm_1_3_2 model """
@@ -1,9 +1,10 @@
 """Core metaclass, writer, and base element class for odmlib ODM models.
 
-This module provides three central components:
+This module provides four central components:
 
 - :class:`ODMMeta` -- metaclass that processes descriptor-based class definitions
 - :class:`ODMWriter` -- utility class for writing ElementTree XML to file
+- :class:`ODMStreamWriter` -- utility class for writing odmlib objects to XML without an ElementTree
 - :class:`ODMElement` -- base class for all ODM element model objects
 
 All model classes (e.g., ``Study``, ``ItemDef``, ``MetaDataVersion``) inherit
@@ -16,20 +17,156 @@ import odmlib.descriptor as DESC
 import odmlib.typed as T
 import odmlib.ns_registry as NS
 import odmlib.oid_index as IDX
+import odmlib.visitor as VIS
 from collections import OrderedDict
+from collections.abc import MutableMapping
+import copy
+import importlib
 import json
+import sys
+import types
 import warnings
 import xml.etree.ElementTree as ET
 from odmlib.exceptions import (
     OdmlibError,
     OdmlibTypeError,
     OdmlibRequiredAttributeError,
-    OdmlibElementOrderError,
     OdmlibWarning,
     ErrorCollector,
 )
 import odmlib.mode as _mode
 
+# storage slot name prefix for the declared fields of compact ODM element classes
+_SLOT_PREFIX = "_slot_"
+# metaclass-generated class attributes that are rebuilt, not copied, by compact_model
+_GENERATED_NAMES = {"_fields", "_elems", "_attrs", "_attr_ns", "_required_attrs", "_init_names", "_assign_names",
+                    "_slot_map", "_slot_orders", "__slots__", "__dict__", "__weakref__"}
+_compact_models: dict = {}
+
+
+class _FieldOrder:
+    """An order in which the fields of a compact ODM element were set.
+
+    The orders of a class form a tree rooted at the empty order, shared by
+    all its instances; ``next`` maps a field name to the order after setting
+    that field, so keeping an instance's insertion order costs one lookup.
+    """
+
+    __slots__ = ("keys", "next")
+
+    def __init__(self, keys=()):
+        self.keys = keys
+        self.next = {key: self for key in keys}
+
+    def after(self, key):
+        """Return the order after ``key`` has been set."""
+        order = self.next.get(key)
+        if order is None:
+            order = self.next[key] = _FieldOrder(self.keys + (key,))
+        return order
+
+
+class _SlotDict(MutableMapping):
+    """Mapping view that stands in for ``__dict__`` on compact ODM elements.
+
+    Declared fields are read from and written to the instance's storage
+    slots, so descriptors and serializers that use ``instance.__dict__`` work
+    unchanged. An unset slot is an absent key. Names that are not declared
+    fields (only stored in permissive mode) go to a lazily created dict.
+    Iteration follows insertion order, as for a ``__dict__``: the fields in
+    the order they were set, then the undeclared names. The order of the set
+    fields is a :class:`_FieldOrder` shared by the instances of the class that
+    set their fields in the same order.
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __getitem__(self, key):
+        obj = self._obj
+        slot = obj._slot_map.get(key)
+        try:
+            if slot is not None:
+                return slot.__get__(obj)
+            return obj._odm_extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        obj = self._obj
+        slot = obj._slot_map.get(key)
+        if slot is not None:
+            order = getattr(obj, "_odm_order", obj._slot_orders)
+            next_order = order.next.get(key) or order.after(key)
+            if next_order is not order:
+                object.__setattr__(obj, "_odm_order", next_order)
+            slot.__set__(obj, value)
+        else:
+            try:
+                obj._odm_extra[key] = value
+            except AttributeError:
+                object.__setattr__(obj, "_odm_extra", {key: value})
+
+    def __delitem__(self, key):
+        obj = self._obj
+        slot = obj._slot_map.get(key)
+        try:
+            if slot is not None:
+                slot.__delete__(obj)
+                order = obj._slot_orders
+                for name in obj._odm_order.keys:
+                    if name != key:
+                        order = order.after(name)
+                object.__setattr__(obj, "_odm_order", order)
+            else:
+                del obj._odm_extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        obj = self._obj
+        yield from getattr(obj, "_odm_order", obj._slot_orders).keys
+        yield from getattr(obj, "_odm_extra", ())
+
+    def __len__(self):
+        obj = self._obj
+        return len(getattr(obj, "_odm_order", obj._slot_orders).keys) + len(getattr(obj, "_odm_extra", ()))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+def _compact_getstate(self):
+    """Return the fields of a compact ODM element, in insertion order, for pickling and copying."""
+    return dict(self.__dict__.items())
+
+
+def _compact_setstate(self, state):
+    """Restore the fields returned by :func:`_compact_getstate`."""
+    fields = self.__dict__
+    for key, value in state.items():
+        fields[key] = value
+
+
+def _compact_reduce(self):
+    """Pickle an element of a :func:`compact_model` class by the names of its model and class."""
+    return _compact_element, (self._model_name, type(self).__name__), _compact_getstate(self)
+
+
+def _compact_element(model_name, class_name):
+    """Return an empty element of a :func:`compact_model` class; used when unpickling."""
+    compact_class = getattr(compact_model(importlib.import_module(model_name)), class_name)
+    return compact_class.__new__(compact_class)
+
 
 class ODMMeta(type):
     """Metaclass for all ODM element classes.
@@ -41,26 +178,42 @@ class ODMMeta(type):
     - Track non-default namespace prefixes (``_attr_ns``)
     - Build the ``_fields`` list of all declared properties
     - Set the default ``namespace`` to "odm" if not specified
+    - Precompute frozen lookup tables used on every construction and
+      assignment: ``_required_attrs`` (required non-element descriptors),
+      ``_init_names`` (names accepted as constructor keyword arguments) and
+      ``_assign_names`` (names accepted by ``__setattr__`` across the MRO)
+    - Bind each :class:`~odmlib.typed.ValidValues` descriptor to the class,
+      resolving its valueset version and membership index once
+    - With the ``compact=True`` class keyword, store the declared fields in
+      ``__slots__`` instead of a per-instance ``__dict__``
     """
 
     @classmethod
-    def __prepare__(cls, name, bases):
+    def __prepare__(cls, name, bases, **kwargs):
         """ preserves the order of declarations in each class """
         return OrderedDict()
 
-    def __new__(cls, clsname, bases, clsdict):
+    def __new__(cls, clsname, bases, clsdict, compact=False):
         """Create a new ODM element class.
 
         Scans ``clsdict`` for :class:`~odmlib.typed.ODMObject`,
         :class:`~odmlib.typed.ODMListObject`, and other
         :class:`~odmlib.descriptor.Descriptor` instances. Populates
-        ``_fields``, ``_elems``, ``_attrs``, and ``_attr_ns`` on the
+        ``_fields``, ``_elems``, ``_attrs``, ``_attr_ns``,
+        ``_required_attrs``, ``_init_names`` and ``_assign_names`` on the
         new class. Sets ``namespace`` to ``"odm"`` if not declared.
 
+        A compact class gets one storage slot per declared field, plus a
+        ``_slot_map`` from field name to slot, the root ``_slot_orders`` of its
+        field orders (see :class:`_FieldOrder`), a ``__dict__`` property returning a
+        :class:`_SlotDict` view over those slots, and ``__getstate__`` and
+        ``__setstate__`` methods that pickle and copy the fields through that view.
+
         Args:
             clsname (str): Name of the class being created.
             bases (tuple): Base classes.
             clsdict (OrderedDict): Class namespace dictionary (ordered).
+            compact (bool): If True, store field values in ``__slots__``.
 
         Returns:
             type: The newly constructed class object.
@@ -97,7 +250,29 @@ class ODMMeta(type):
         #       if val.namespace != "odm"}
         # clsdict["_attr_ns"] = ns
 
+        clsdict["_required_attrs"] = tuple(
+            key for key, val in clsdict.items()
+            if isinstance(val, DESC.Descriptor) and not isinstance(val, T.ODMObject) and val.required
+        )
+        clsdict["_init_names"] = frozenset()
+        clsdict["_assign_names"] = frozenset()
+        if compact:
+            clsdict["__slots__"] = tuple(_SLOT_PREFIX + key for key in clsdict["_fields"]) + ("_odm_order",
+                                                                                              "_odm_extra")
+            clsdict["__dict__"] = property(_SlotDict)
+            clsdict.setdefault("__getstate__", _compact_getstate)
+            clsdict.setdefault("__setstate__", _compact_setstate)
+
         clsobj = super().__new__(cls, clsname, bases, dict(clsdict))
+        # constructor keywords are checked against the class's own namespace, assignments against the whole MRO
+        clsobj._init_names = frozenset(clsobj.__dict__)
+        clsobj._assign_names = frozenset(key for base in clsobj.__mro__ for key in base.__dict__)
+        if compact:
+            clsobj._slot_map = {key: clsobj.__dict__[_SLOT_PREFIX + key] for key in clsobj._fields}
+            clsobj._slot_orders = _FieldOrder()
+        for val in clsobj._attrs.values():
+            if isinstance(val, T.ValidValues):
+                val.bind(clsobj)
         return clsobj
 
 
@@ -122,6 +297,125 @@ class ODMWriter:
         tree.write(odm_file, xml_declaration=True, encoding='UTF-8', method='xml', short_empty_elements=True)
 
 
+def _escape_cdata(text):
+    """Escape XML character data exactly as ElementTree serializes it."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _escape_attrib(text):
+    """Escape an XML attribute value exactly as ElementTree serializes it."""
+    text = _escape_cdata(text)
+    if "\"" in text:
+        text = text.replace("\"", "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+class ODMStreamWriter:
+    """Writes an odmlib object hierarchy to an XML file without building an ElementTree.
+
+    Start and end tags are written incrementally while walking the odmlib
+    hierarchy, so peak memory is the odmlib tree alone. The output is
+    byte-for-byte what :class:`ODMWriter` produces for the same hierarchy,
+    including the namespace declarations added to the root element by
+    :meth:`~odmlib.ns_registry.NamespaceRegistry.set_odm_namespace_attributes`.
+    """
+
+    chunk_size = 1 << 16
+    """Number of characters buffered before they are encoded and written."""
+
+    def write_odm(self, odm_file, odm_obj):
+        """
+        walk the odmlib hierarchy and write it as XML to an ODM file
+        :param odm_file: path and file to write the ODM XML, or a binary file object
+        :param odm_obj: odmlib object to write (presumably an ODM root)
+        """
+        if hasattr(odm_file, "write"):
+            self._write_document(odm_file, odm_obj)
+        else:
+            with open(odm_file, "wb") as out:
+                self._write_document(out, odm_obj)
+
+    def _write_document(self, out, odm_obj):
+        self._out = out
+        self._buffer = []
+        self._buffered = 0
+        # workaround for elementtree NS bug - NamespaceRegistry assumes at least 1 default NS has been set
+        ns_elem = ET.Element(odm_obj.__class__.__name__)
+        NS.NamespaceRegistry().set_odm_namespace_attributes(ns_elem)
+        self._emit("<?xml version='1.0' encoding='UTF-8'?>\n")
+        self._write_element(odm_obj, ns_elem.attrib)
+        self._flush()
+
+    def _write_element(self, odm_obj, ns_attrs=None):
+        tag = odm_obj.__class__.__name__
+        if odm_obj.namespace != "odm":
+            tag = odm_obj.namespace + ":" + tag
+        attrs = self._attributes(odm_obj, ns_attrs)
+        start = "<" + tag + "".join(" " + k + "=\"" + _escape_attrib(v) + "\"" for k, v in attrs.items())
+        text = odm_obj.__dict__.get("_content")
+        children = self._children(odm_obj)
+        if not text and not children:
+            self._emit(start + " />")
+            return
+        self._emit(start + ">")
+        if text:
+            self._emit(_escape_cdata(text))
+        for child in children:
+            self._write_element(child)
+        self._emit("</" + tag + ">")
+
+    @staticmethod
+    def _attributes(odm_obj, ns_attrs=None):
+        """Return the XML attributes of an element, with namespace prefixes, followed by ``ns_attrs``."""
+        attr_ns = odm_obj._attr_ns
+        attrs = {}
+        for attr, obj in odm_obj.__dict__.items():
+            if not isinstance(obj, (ODMElement, list)) and attr != "_content" and obj is not None:
+                # add namespace if not the default namespace
+                if attr in attr_ns:
+                    attrs[attr_ns[attr] + ":" + attr] = str(obj)
+                else:
+                    attrs[attr] = str(obj)
+        if ns_attrs:
+            attrs.update(ns_attrs)
+        return attrs
+
+    @staticmethod
+    def _children(odm_obj):
+        """Return the child elements of an element in model declaration order."""
+        children = []
+        for name in odm_obj._elems:
+            obj = odm_obj.__dict__.get(name)
+            if isinstance(obj, list):
+                children.extend(obj)
+            elif isinstance(obj, ODMElement):
+                children.append(obj)
+        return children
+
+    def _emit(self, data):
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        self._out.write("".join(self._buffer).encode("utf-8", "xmlcharrefreplace"))
+        self._buffer = []
+        self._buffered = 0
+
+
 class ODMElement(metaclass=ODMMeta):
     """Base class for all ODM element model objects.
 
@@ -147,8 +441,13 @@ class ODMElement(metaclass=ODMMeta):
         - :meth:`find` -- find first child element by attribute value
         - :meth:`find_all` -- find all matching child elements
         - :meth:`find_by` -- find by multiple attribute criteria
+
+    Model classes keep their values in a per-instance ``__dict__`` unless
+    declared with ``compact=True`` (see :func:`compact_model`).
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize an ODM element with keyword arguments.
 
@@ -164,8 +463,9 @@ class ODMElement(metaclass=ODMMeta):
             OdmlibTypeError: If an unknown keyword argument is provided.
             OdmlibRequiredAttributeError: If a required attribute is missing.
         """
+        cls = self.__class__
         for name, val in kwargs.items():
-            if name not in self.__class__.__dict__.keys():
+            if name not in cls._init_names:
                 # strip out non-default elementtree namespaces from the XML to work with just the name e.g. xml:lang
                 if "}" in name:
                     name = name[name.find('}') + 1:]
@@ -180,9 +480,9 @@ class ODMElement(metaclass=ODMMeta):
                         )
                     continue
             setattr(self, name, val)
-        if not _mode.is_permissive(_mode.ValidationMode.SKIP_REQUIRED):
-            for attr, obj in self.__class__.__dict__.items():
-                if isinstance(obj, DESC.Descriptor) and (not isinstance(obj, T.ODMObject)) and (attr not in self.__dict__) and obj.required:
+        if cls._required_attrs and not _mode.is_permissive(_mode.ValidationMode.SKIP_REQUIRED):
+            for attr in cls._required_attrs:
+                if attr not in self.__dict__:
                     raise OdmlibRequiredAttributeError(
                         f"Missing required keyword argument {attr} in {self.__class__.__name__}",
                         attribute=attr,
@@ -204,7 +504,7 @@ class ODMElement(metaclass=ODMMeta):
             OdmlibTypeError: If ``key`` is not a declared attribute on this class.
         """
         """ ensure the object being added is a type that belongs to the class """
-        if not any(key in cls.__dict__ for cls in type(self).__mro__):
+        if key not in type(self)._assign_names:
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_TYPE):
                 raise OdmlibTypeError(
                     f"Assignment error: {self.__class__.__name__} does not have a defined attribute {key}",
@@ -244,8 +544,8 @@ class ODMElement(metaclass=ODMMeta):
         for attr, obj in self.__dict__.items():
             if not isinstance(obj, (ODMElement, list)) and attr != "_content" and obj is not None:
                 # add namespace if not the default namespace
-                if attr in self.__class__.__dict__["_attr_ns"]:
-                    attrs[self.__class__.__dict__["_attr_ns"][attr] + ":" + attr] = str(obj)
+                if attr in self._attr_ns:
+                    attrs[self._attr_ns[attr] + ":" + attr] = str(obj)
                 else:
                     attrs[attr] = str(obj)
 
@@ -286,16 +586,9 @@ class ODMElement(metaclass=ODMMeta):
         :return: dictionary serialization of odmlib hierarchy
         """
         # Note: namespaces used in the XML serialization are not part of the dictionary or json serializations
-        property_dict = {}
-        odm_content = {attr: obj for attr, obj in self.__dict__.items() if attr not in ["_fields", "_attr_ns", "_elems", "_attrs"]}
-        for attr, obj in odm_content.items():
-            if isinstance(obj, ODMElement):
-                property_dict[attr] = obj.to_dict()                    # element
-            elif isinstance(obj, list):
-                property_dict[attr] = [o.to_dict() for o in obj]       # list of ELEMENTS
-            elif obj is not None:
-                property_dict[attr] = obj                              # attributes
-        return property_dict
+        builder = VIS.DictBuilder()
+        VIS.walk(self, builder)
+        return builder.result
 
     def __repr__(self):
         """Return a developer-readable representation of this element.
@@ -381,13 +674,18 @@ class ODMElement(metaclass=ODMMeta):
                 return o
         return None
 
-    def write_xml(self, odm_file: str, odm_writer: type = ODMWriter) -> None:
+    def write_xml(self, odm_file: str, odm_writer: type = ODMWriter, streaming: bool = False) -> None:
         """
         write the odmlib hierarchy as an XML file
 
-        :param odm_file: string ODM filename and path
+        :param odm_file: string ODM filename and path (or a binary file object when streaming)
         :param odm_writer: object used to write the elementree XML to a file
+        :param streaming: if True, write tags incrementally with ODMStreamWriter instead of building an
+            ElementTree first; the output is identical and odm_writer is not used
         """
+        if streaming:
+            ODMStreamWriter().write_odm(odm_file, self)
+            return
         odm_elem = self.to_xml()
         odm_writer = odm_writer()
         odm_writer.write_odm(odm_file, odm_elem)
@@ -420,17 +718,7 @@ class ODMElement(metaclass=ODMMeta):
 
         :return oid_index: object that provices a dictionary lookup based on OID
         """
-        odm_content = {attr: obj for attr, obj in self.__dict__.items() if attr not in ["_fields", "_attr_ns", "_elems", "_attrs"]}
-        for attr, obj in odm_content.items():
-            if isinstance(obj, ODMElement):
-                obj._init_oid_index(idx)                    # element
-            elif isinstance(obj, list):
-                for o in obj:
-                    o._init_oid_index(idx)                  # list of ELEMENTS
-            else:
-                if attr == "OID" or "OID" in attr:
-                    idx.add_oid(obj, self)
-        return
+        VIS.walk(self, VIS.OIDIndexVisitor(idx))
 
     def verify_oids(self, oid_checker: Any) -> bool:
         """
@@ -463,27 +751,20 @@ class ODMElement(metaclass=ODMMeta):
 
         :param oid_checker: object used to check OIDs for uniqueness and Def/Ref check
         """
-        odm_content = {attr: obj for attr, obj in self.__dict__.items() if attr not in ["_fields", "_attr_ns", "_elems", "_attrs"]}
-        for attr, obj in odm_content.items():
-            if isinstance(obj, ODMElement):
-                obj._init_oid_check(oid_checker)                    # element
-            elif isinstance(obj, list):
-                for o in obj:
-                    o._init_oid_check(oid_checker)                  # list of ELEMENTS
-            else:
-                # assumes consistency in OID naming. Exceptions: FileOID and PriorFileOID in ODM
-                if attr == "OID":
-                    oid_checker.add_oid(obj, self.__class__.__name__)
-                elif "OID" in attr:
-                    oid_checker.add_oid_ref(obj, attr)
-        return
+        VIS.walk(self, VIS.OIDCheckVisitor(oid_checker))
 
     def verify_conformance(self, validator: Any) -> Any:
         """
         uses validator object to check object for conformance with the model
 
+        A validator with a ``check_object_conformance`` method, such as
+        :class:`~odmlib.conformance.ModelConformanceChecker`, checks the objects directly; any other validator
+        checks the :meth:`to_dict` serialization of the object.
+
         :param validator: object that validates the odmlib object against the model
         """
+        if hasattr(validator, "check_object_conformance"):
+            return validator.check_object_conformance(self)
         doc_dict = self.to_dict()
         result = validator.check_conformance(doc_dict, type(self).__name__)
         return result
@@ -491,8 +772,8 @@ class ODMElement(metaclass=ODMMeta):
     def verify_order(self) -> bool:
         """Verify that child elements are in the model declaration order.
 
-        Recursively checks this element and all descendants — calling at
-        the odmlib root covers the whole document. Works on any
+        Checks this element and all descendants in one iterative walk —
+        calling at the odmlib root covers the whole document. Works on any
         :class:`ODMElement` subclass; not applicable to
         :class:`xml.etree.ElementTree.Element` (load through a loader
         first if you only have an ElementTree).
@@ -527,22 +808,7 @@ class ODMElement(metaclass=ODMMeta):
             OdmlibElementOrderError: If any element has children out of
                 order. Use :meth:`reorder_object` to fix automatically.
         """
-        odm_content = {attr: obj for attr, obj in self.__dict__.items() if attr not in ["_fields", "_attr_ns", "_elems", "_attrs"]}
-        obj_list = [key for key in list(self.__dict__.keys()) if key != "_content" and key not in self._attrs]
-        elem_list = [elem for elem in self._elems if elem in obj_list]
-        if obj_list != elem_list:
-            raise OdmlibElementOrderError(
-                f"The order of elements in {self.__class__.__name__} should be "
-                f"{', '.join(key for key in self._elems.keys())}",
-                element_type=self.__class__.__name__,
-                hint="Use reorder_object() to fix element ordering automatically",
-            )
-        for attr, obj in odm_content.items():
-            if isinstance(obj, ODMElement):
-                obj.verify_order()
-            elif isinstance(obj, list):
-                for o in obj:
-                    o.verify_order()
+        VIS.walk(self, VIS.OrderVisitor())
         return True
 
     def reorder_object(self) -> None:
@@ -570,7 +836,7 @@ class ODMElement(metaclass=ODMMeta):
         for name, elem in ordered_obj.items():
             self.__dict__[name] = elem
 
-    def validate(self, collect_errors=False, oid_checker=None, conformance_checker=None):
+    def validate(self, collect_errors=False, oid_checker=None, conformance_checker=None, single_pass=False):
         """Validate this element and all children.
 
         Args:
@@ -578,14 +844,26 @@ class ODMElement(metaclass=ODMMeta):
                 list instead of raising on the first failure. Defaults to False
                 (fail-fast, existing behaviour).
             oid_checker: Optional OIDRef instance for OID validation.
-            conformance_checker: Optional MetadataSchema instance for
-                conformance validation.
+            conformance_checker: Optional MetadataSchema or
+                :class:`~odmlib.conformance.ModelConformanceChecker` instance
+                for conformance validation.
+            single_pass: If True, check order, OIDs and conformance in one
+                walk over the object tree with
+                :class:`~odmlib.visitor.ValidationVisitor`. Conformance is then
+                checked element by element, without serializing the document
+                through :meth:`to_dict`, and a conformance error names the
+                first failing element rather than the root. Errors are raised
+                or collected with the same precedence: order, then OIDs, then
+                conformance.
 
         Returns:
             If ``collect_errors=False``: ``True`` (or raises on first error).
             If ``collect_errors=True``: list of :class:`~odmlib.exceptions.OdmlibError`
             instances (empty list means valid).
         """
+        if single_pass:
+            return self._validate_single_pass(collect_errors, oid_checker, conformance_checker)
+
         if not collect_errors:
             # Fail-fast — preserves existing behaviour exactly
             self.verify_order()
@@ -595,6 +873,38 @@ class ODMElement(metaclass=ODMMeta):
                 self.verify_conformance(conformance_checker)
             return True
 
+        return self._collect_validation_errors(oid_checker, conformance_checker)
+
+    def _validate_single_pass(self, collect_errors, oid_checker, conformance_checker):
+        """Run :meth:`validate` with ``single_pass=True`` as one :class:`~odmlib.visitor.ValidationVisitor` walk.
+
+        Args:
+            collect_errors: Return the errors instead of raising the first one.
+            oid_checker: Optional OIDRef instance for OID validation.
+            conformance_checker: Optional conformance checker.
+
+        Returns:
+            ``True``, or the list of errors if ``collect_errors`` is True.
+        """
+        visitor = VIS.ValidationVisitor(oid_checker, conformance_checker, fail_fast=not collect_errors)
+        VIS.walk(self, visitor)
+        errors = visitor.errors()
+        if collect_errors:
+            return errors
+        if errors:
+            raise errors[0]
+        return True
+
+    def _collect_validation_errors(self, oid_checker, conformance_checker):
+        """Run the order, OID and conformance checks of :meth:`validate` and return all their errors.
+
+        Args:
+            oid_checker: Optional OIDRef instance for OID validation.
+            conformance_checker: Optional conformance checker.
+
+        Returns:
+            list: :class:`~odmlib.exceptions.OdmlibError` instances; empty if the element is valid.
+        """
         collector = ErrorCollector()
 
         try:
@@ -616,3 +926,65 @@ class ODMElement(metaclass=ODMMeta):
 
         return collector.errors
 
+
+def _compact_class(element_class: ODMMeta, model_name: str, module_name: str) -> ODMMeta:
+    """Return the compact variant of an element class of a model; see :func:`compact_model`."""
+    # the compact class derives from ODMElement only, so it takes the declarations of the whole MRO
+    clsdict = OrderedDict()
+    for klass in reversed(element_class.__mro__):
+        if klass in ODMElement.__mro__:
+            continue
+        for key, val in klass.__dict__.items():
+            if key not in _GENERATED_NAMES and not key.startswith(_SLOT_PREFIX):
+                clsdict[key] = val
+    for key, val in clsdict.items():
+        if isinstance(val, DESC.Descriptor):
+            clsdict[key] = copy.copy(val)
+    clsdict.update(__module__=module_name, __qualname__=element_class.__qualname__, _model_name=model_name)
+    clsdict.setdefault("__reduce__", _compact_reduce)
+    return ODMMeta(element_class.__name__, (ODMElement,), clsdict, compact=True)
+
+
+def compact_model(model: Any) -> types.ModuleType:
+    """Return a variant of an odmlib model module whose element classes use slot storage.
+
+    Each :class:`ODMElement` subclass defined in ``model`` is recreated with
+    ``compact=True`` from copies of its descriptors, including those it
+    inherits from other element classes, and child element descriptors are
+    pointed at the compact classes. Compact objects serialize, validate and
+    load exactly like the originals, but are not instances of the original
+    classes. Attributes iterate in insertion order, as with a ``__dict__``.
+    The compact module is registered in ``sys.modules`` as
+    ``<model name>_compact``, and compact objects pickle by the names of
+    ``model`` and their class. Results are cached per model module.
+
+    Args:
+        model: An odmlib model module, e.g. ``odmlib.odm_1_3_2.model``.
+
+    Returns:
+        types.ModuleType: A module with the same names as ``model``.
+
+    Example::
+
+        import odmlib.odm_1_3_2.model as ODM
+        CODM = compact_model(ODM)
+        item = CODM.ItemData(ItemOID="IT.VSORRES", Value="120")
+    """
+    if model.__name__ in _compact_models:
+        return _compact_models[model.__name__]
+    module_name = f"{model.__name__}_compact"
+    classes = {}
+    for obj in vars(model).values():
+        if isinstance(obj, ODMMeta) and obj is not ODMElement and obj.__module__ == model.__name__:
+            classes[obj] = _compact_class(obj, model.__name__, module_name)
+    for compact_class in classes.values():
+        for desc in compact_class._elems.values():
+            if desc.element_class in classes:
+                desc.element_class = desc.obj_type = classes[desc.element_class]
+    compact = types.ModuleType(module_name, model.__doc__)
+    compact.__dict__.update({key: classes.get(val, val) if isinstance(val, ODMMeta) else val
+                             for key, val in vars(model).items()
+                             if key not in ("__name__", "__doc__", "__spec__", "__loader__")})
+    sys.modules[module_name] = compact
+    _compact_models[model.__name__] = compact
+    return compact
@@ -10,10 +10,11 @@ These loaders are typically used via the :class:`~odmlib.loader.ODMLoader`
 facade rather than directly.
 """
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 import odmlib.document_loader as DL
 import odmlib.odm_parser as P
 import odmlib.ns_registry as NS
+import odmlib.odm_element as OE
 import json
 import importlib
 import xml.etree.ElementTree as ET
@@ -38,12 +39,20 @@ class JSONODMLoader(DL.DocumentLoader):
         model_package (str): Package name to load models from
             (default: "odm_1_3_2"). Options: "odm_1_3_2", "odm_2_0",
             "dataset_1_0_1", "ct_1_1_1".
+        compact (bool): If True, load into the slot-backed classes built by
+            :func:`odmlib.odm_element.compact_model` to reduce memory use.
+        trusted (bool): If True, skip descriptor validation and store
+            attribute values directly, with integer and float coercion only.
+            Use only for input that has already been schema validated.
     """
 
-    def __init__(self, model_package: str = "odm_1_3_2") -> None:
+    def __init__(self, model_package: str = "odm_1_3_2", compact: bool = False, trusted: bool = False) -> None:
         self.filename: Optional[str] = None
         self.odm_dict: dict = {}
+        self.trusted = trusted
         self.ODM = importlib.import_module(f"odmlib.{model_package}.model")
+        if compact:
+            self.ODM = OE.compact_model(self.ODM)
 
     def load_document(self, odm_dict: dict, key: str) -> Any:
         """Recursively load a dict into an odmlib object tree.
@@ -61,13 +70,19 @@ class JSONODMLoader(DL.DocumentLoader):
         """
         attrib = {k: value for k, value in odm_dict.items() if not isinstance(value, (list, dict))}
         elem_class = getattr(self.ODM, key)
-        odm_obj = elem_class(**attrib)
+        if self.trusted:
+            odm_obj = DL.create_trusted_object(elem_class, attrib)
+        else:
+            odm_obj = elem_class(**attrib)
         odm_obj_items = elem_class.__dict__.items()
         for k, v in odm_obj_items:
             if type(v).__name__ == "ODMObject":
                 if k in odm_dict:
                     odm_child_obj = self.load_document(odm_dict[k], k)
-                    setattr(odm_obj, k, odm_child_obj)
+                    if self.trusted:
+                        odm_obj.__dict__[k] = odm_child_obj
+                    else:
+                        setattr(odm_obj, k, odm_child_obj)
             elif type(v).__name__ == "ODMListObject":
                 if k in odm_dict:
                     for val in odm_dict[k]:
@@ -195,16 +210,26 @@ class XMLODMLoader(DL.DocumentLoader):
             variants.
         local_model (bool): If True, ``model_package`` is a full module path.
         nsr: Optional pre-configured NamespaceRegistry instance.
+        compact (bool): If True, load into the slot-backed classes built by
+            :func:`odmlib.odm_element.compact_model` to reduce memory use.
+        trusted (bool): If True, skip descriptor validation and store
+            attribute values directly, with integer and float coercion only.
+            Use only for input that has already been schema validated, e.g.
+            with :class:`~odmlib.odm_parser.ODMSchemaValidator`.
     """
 
     def __init__(self, model_package: str = "odm_1_3_2", ns_uri: Optional[str] = None,
-                 local_model: bool = False, nsr: Optional[Any] = None) -> None:
+                 local_model: bool = False, nsr: Optional[Any] = None, compact: bool = False,
+                 trusted: bool = False) -> None:
         self.filename: Optional[str] = None
         self.parser: Optional[Any] = None
+        self.trusted = trusted
         if local_model:
             self.ODM = importlib.import_module(f"{model_package}.model")
         else:
             self.ODM = importlib.import_module(f"odmlib.{model_package}.model")
+        if compact:
+            self.ODM = OE.compact_model(self.ODM)
         if ns_uri is None:
             ns_uri = _DEFAULT_ODM_NS_URI.get(model_package, "http://www.cdisc.org/ns/odm/v1.3")
         self.ns_uri = ns_uri
@@ -218,12 +243,14 @@ class XMLODMLoader(DL.DocumentLoader):
             # global "odm" mapping silently overwritten when ns_uri is a
             # non-canonical wrapper URI.
             self.nsr = NS.NamespaceRegistry()
+            self._child_tables = DL.ChildTagTables(self.nsr)
 
     def load_document(self, elem: ET.Element, *args: Any) -> Any:
         """Recursively load an XML element into an odmlib object tree.
 
         Strips the namespace URI from the tag name, instantiates the
-        matching odmlib class, and recurses into child elements.
+        matching odmlib class, and recurses into child elements. The
+        children of ``elem`` are scanned once and dispatched by qualified tag.
 
         Args:
             elem (ET.Element): The XML element to load.
@@ -236,22 +263,13 @@ class XMLODMLoader(DL.DocumentLoader):
         elem_class = getattr(self.ODM, elem_name)
         if elem.text and not elem.text.isspace():
             attrib = {**elem.attrib, **{"_content": elem.text}}
-            odm_obj = elem_class(**attrib)
         else:
-            odm_obj = elem_class(**elem.attrib)
-        odm_obj_dict = elem_class.__dict__.items()
-        for k, v in odm_obj_dict:
-            if type(v).__name__ == "ODMObject":
-                namespace = self.nsr.get_ns_entry_dict(v.namespace)
-                e = elem.find(v.namespace + ":" + k, namespace)
-                if e is not None:
-                    odm_child_obj = self.load_document(e)
-                    setattr(odm_obj, k, odm_child_obj)
-            elif type(v).__name__ == "ODMListObject":
-                namespace = self.nsr.get_ns_entry_dict(v.namespace)
-                for e in elem.findall(v.namespace + ":" + k, namespace):
-                    odm_child_obj = self.load_document(e)
-                    getattr(odm_obj, k).append(odm_child_obj)
+            attrib = elem.attrib
+        if self.trusted:
+            odm_obj = DL.create_trusted_object(elem_class, attrib)
+        else:
+            odm_obj = elem_class(**attrib)
+        DL.load_xml_children(odm_obj, elem, self._child_tables.get(elem_class), self.load_document, self.trusted)
         return odm_obj
 
     def create_document(self, filename: str, namespace_registry: Optional[Any] = None) -> ET.Element:
@@ -303,6 +321,41 @@ class XMLODMLoader(DL.DocumentLoader):
             self.nsr = namespace_registry
         else:
             self.nsr = NS.NamespaceRegistry(prefix="odm", uri=self.ns_uri, is_default=True)
+        self._child_tables = DL.ChildTagTables(self.nsr)
+
+    def iter_elements(self, filename: Any, element: str = "SubjectData", ns_prefix: str = "odm",
+                      namespace_registry: Optional[Any] = None) -> Iterator[Any]:
+        """Stream odmlib objects of one element type from an ODM XML file.
+
+        Parses ``filename`` incrementally with :class:`~odmlib.odm_parser.ODMIterParser`
+        and yields a fully built odmlib object for each ``element`` as soon as
+        its closing tag has been read. The consumed XML nodes are cleared, so
+        peak memory is bounded by the largest single ``element`` rather than
+        the document size. The stored document used by :meth:`load_odm` and
+        the other ``load_*`` methods is not affected.
+
+        Args:
+            filename: Path to, or binary file object of, the ODM XML file.
+            element (str): Local name of the element to yield
+                (default: ``"SubjectData"``).
+            ns_prefix (str): Registered namespace prefix of ``element``
+                (default: ``"odm"``).
+            namespace_registry: Optional pre-configured
+                :class:`~odmlib.ns_registry.NamespaceRegistry` instance.
+
+        Yields:
+            An odmlib object (e.g. ``SubjectData``) per matching element.
+
+        Example::
+
+            loader = OL.XMLODMLoader(model_package="odm_1_3_2")
+            for subject in loader.iter_elements("clinical_data.xml", "SubjectData"):
+                print(subject.SubjectKey)
+        """
+        self._set_namespace(namespace_registry)
+        parser = P.ODMIterParser(filename, self.nsr)
+        for elem in parser.iterparse(element, ns_prefix=ns_prefix):
+            yield self.load_document(elem)
 
     def load_odm(self) -> Any:
         """Return the root ODM object loaded from the stored document.
@@ -2,14 +2,166 @@ import xml.etree.ElementTree as ET
 import xmlschema as XSD
 import odmlib.ns_registry as NS
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+import hashlib
 import json
+import os
+import pickle
+import sys
+import tempfile
 from . import schema_manager as SM
 from odmlib.exceptions import OdmlibSchemaValidationError  # noqa: F401  re-exported
+from odmlib.exceptions import OdmlibNamespaceError
+
+try:
+    from lxml import etree as LXML
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+SCHEMA_BACKENDS = ("xmlschema", "lxml")
 
 ODM_NS = {'odm': 'http://www.cdisc.org/ns/odm/v1.3'}
 ODM_PREFIX = "odm:"
 
+# compiled schemas by absolute path of the main XSD file: (dependencies, XMLSchema)
+_schema_cache: dict = {}
+
+
+def _schema_dependencies(xsd: XSD.XMLSchema) -> tuple:
+    """Return ``(path, mtime_ns)`` for every local file the compiled schema was built from."""
+    dependencies = []
+    for schema in xsd.maps.iter_schemas():
+        url = urlsplit(schema.url or "")
+        if url.scheme in ("", "file"):
+            path = url2pathname(url.path)
+            dependencies.append((path, os.stat(path).st_mtime_ns))
+    return tuple(sorted(dependencies))
+
+
+def _dependencies_current(dependencies: tuple) -> bool:
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dependencies)
+    except OSError:
+        return False
+
+
+def _disk_cache_file(xsd_path: str, cache_dir: str) -> str:
+    key = f"{xsd_path}|{XSD.__version__}|{sys.version_info[:2]}"
+    return os.path.join(cache_dir, f"xsd-{hashlib.sha256(key.encode()).hexdigest()[:32]}.pickle")
+
+
+def _read_disk_cache(cache_file: str, xsd_path: str) -> Optional[tuple]:
+    """Return ``(dependencies, XMLSchema)`` from ``cache_file``, or None if it is missing or stale."""
+    try:
+        with open(cache_file, "rb") as f:
+            header = pickle.load(f)
+            if header.get("xsd_path") != xsd_path or not _dependencies_current(header["dependencies"]):
+                return None
+            return header["dependencies"], pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, KeyError, TypeError):
+        return None
+
+
+def _write_disk_cache(cache_file: str, xsd_path: str, dependencies: tuple, xsd: XSD.XMLSchema) -> None:
+    """Write the compiled schema to ``cache_file`` atomically; failures leave the cache unchanged."""
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"xsd_path": xsd_path, "dependencies": dependencies}, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(xsd, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pickle.PicklingError, RecursionError, TypeError):
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def get_compiled_schema(xsd_file, cache_dir=None) -> XSD.XMLSchema:
+    """Return the compiled ``XMLSchema`` for ``xsd_file``, compiling it at most once per process.
+
+    Compiled schemas are cached in memory by the absolute path of the XSD
+    file. A cached schema is reused as long as the modification times of the
+    XSD file and of every file it includes or imports are unchanged.
+
+    With ``cache_dir``, the compiled schema is also pickled to that directory,
+    so that a new process can load it instead of compiling the XSD files. The
+    on-disk copy is checked against the same modification times and is
+    specific to the xmlschema and Python versions. Only point ``cache_dir`` at
+    a directory you trust: the cache files are unpickled.
+
+    Args:
+        xsd_file: Path to the main XSD file.
+        cache_dir: Optional directory for the on-disk schema cache.
+
+    Returns:
+        xmlschema.XMLSchema: The compiled schema.
+    """
+    xsd_path = os.path.abspath(os.fspath(xsd_file))
+    cached = _schema_cache.get(xsd_path)
+    if cached is not None and _dependencies_current(cached[0]):
+        return cached[1]
+    cache_file = _disk_cache_file(xsd_path, os.fspath(cache_dir)) if cache_dir else None
+    cached = _read_disk_cache(cache_file, xsd_path) if cache_file else None
+    if cached is None:
+        xsd = XSD.XMLSchema(xsd_path)
+        cached = (_schema_dependencies(xsd), xsd)
+        if cache_file:
+            _write_disk_cache(cache_file, xsd_path, *cached)
+    _schema_cache[xsd_path] = cached
+    return cached[1]
+
+
+def _require_lxml() -> None:
+    """Raise ImportError if lxml is not installed."""
+    if not HAS_LXML:
+        raise ImportError(
+            "lxml is required for the 'lxml' schema validation backend.\n"
+            "Install it with:  pip install lxml"
+        )
+
+
+def get_compiled_lxml_schema(xsd_file):
+    """Return the compiled ``lxml.etree.XMLSchema`` for ``xsd_file``, compiling it at most once per process.
+
+    libxml2 does not report which files a schema includes, so a cached schema
+    is reused as long as the modification times of the XSD files in the
+    directory of ``xsd_file`` are unchanged. lxml schemas cannot be pickled,
+    so there is no on-disk cache for this backend.
+
+    Args:
+        xsd_file: Path to the main XSD file.
+
+    Returns:
+        lxml.etree.XMLSchema: The compiled schema.
+
+    Raises:
+        ImportError: If lxml is not installed.
+    """
+    _require_lxml()
+    xsd_path = os.path.abspath(os.fspath(xsd_file))
+    cache_key = ("lxml", xsd_path)
+    cached = _schema_cache.get(cache_key)
+    if cached is not None and _dependencies_current(cached[0]):
+        return cached[1]
+    xsd_dir = os.path.dirname(xsd_path)
+    dependencies = tuple(sorted(
+        (path, os.stat(path).st_mtime_ns)
+        for path in (os.path.join(xsd_dir, name) for name in os.listdir(xsd_dir))
+        if path.endswith(".xsd") or path == xsd_path
+    ))
+    xsd = LXML.XMLSchema(LXML.parse(xsd_path))
+    _schema_cache[cache_key] = (dependencies, xsd)
+    return xsd
+
+
+def clear_schema_cache() -> None:
+    """Drop all compiled schemas cached in memory by :func:`get_compiled_schema`
+    and :func:`get_compiled_lxml_schema`."""
+    _schema_cache.clear()
+
 
 class SchemaValidator(ABC):
     @abstractmethod
@@ -25,7 +177,7 @@ class SchemaValidator(ABC):
 
 class ODMSchemaValidator(SchemaValidator):
     def __init__(self, xsd_file=None, standard: Optional[str] = None,
-                 version: Optional[str] = None):
+                 version: Optional[str] = None, cache_dir=None, backend: str = "xmlschema"):
         """Initialize the ODM schema validator.
 
         Provide either an explicit ``xsd_file`` path, or both ``standard``
@@ -45,13 +197,27 @@ class ODMSchemaValidator(SchemaValidator):
                 together with ``version`` when ``xsd_file`` is omitted.
             version: Version string (e.g. ``"1.3.2"``, ``"2.1"``). Required
                 together with ``standard`` when ``xsd_file`` is omitted.
+            cache_dir: Optional directory for the on-disk cache of compiled
+                schemas. The compiled schema is always cached in memory and
+                shared by all validators for the same XSD file (see
+                :func:`get_compiled_schema`). Ignored by the ``"lxml"`` backend.
+            backend: Validation engine. ``"xmlschema"`` (default) is pure
+                Python and reports detailed error paths; ``"lxml"`` validates
+                with libxml2, which is much faster on large documents. Both
+                raise :exc:`OdmlibSchemaValidationError` from
+                :meth:`validate_file`. ``self.xsd`` holds the compiled schema
+                of the selected backend.
 
         Raises:
             ValueError: If ``xsd_file`` is not provided and ``standard``
                 and ``version`` are not both provided. Previously this
                 silently fell back to ODM 1.3.2, which could mask schema
                 version mismatches; an explicit choice is now required.
+                Also raised for an unknown ``backend``.
+            ImportError: If ``backend="lxml"`` and lxml is not installed.
         """
+        if backend not in SCHEMA_BACKENDS:
+            raise ValueError(f"Unknown schema validation backend {backend!r}; valid backends are {SCHEMA_BACKENDS}")
         if xsd_file is None:
             if standard is None or version is None:
                 raise ValueError(
@@ -66,19 +232,96 @@ class ODMSchemaValidator(SchemaValidator):
                     "pass xsd_file='/path/to/your/schema.xsd' instead."
                 )
             xsd_file = SM.get_schema_path(standard, version)
-        self.xsd = XSD.XMLSchema(xsd_file)
+        self.backend = backend
+        self.xsd_file = xsd_file
+        self.cache_dir = cache_dir
+        if backend == "lxml":
+            self.xsd = get_compiled_lxml_schema(xsd_file)
+        else:
+            self.xsd = get_compiled_schema(xsd_file, cache_dir)
+
+    @staticmethod
+    def _lxml_document(source):
+        """Return an lxml document or element for a file path, file object, or stdlib/lxml tree."""
+        if LXML.iselement(source) or isinstance(source, LXML._ElementTree):
+            return source
+        if isinstance(source, ET.ElementTree):
+            source = source.getroot()
+        if isinstance(source, ET.Element):
+            return LXML.fromstring(ET.tostring(source))
+        return LXML.parse(os.fspath(source) if isinstance(source, os.PathLike) else source)
 
     def validate_tree(self, tree):
+        if self.backend == "lxml":
+            return self.xsd.validate(self._lxml_document(tree))
         result = self.xsd.is_valid(tree)
         return result
 
     def validate_file(self, odm_file):
+        if self.backend == "lxml":
+            try:
+                self.xsd.assertValid(self._lxml_document(odm_file))
+            except LXML.DocumentInvalid as ex:
+                line = ex.error_log[0].line if len(ex.error_log) else None
+                raise OdmlibSchemaValidationError(
+                    ex, line=line,
+                    hint=f"{len(ex.error_log)} schema error(s); the first is on line {line}" if line else None)
+            return None
         try:
             result = self.xsd.validate(odm_file)
-        except XSD.validators.exceptions.XMLSchemaChildrenValidationError as ex:
+        except XSD.XMLSchemaValidationError as ex:
             raise OdmlibSchemaValidationError(ex)
         return result
 
+    def iter_errors(self, odm_file, max_errors: Optional[int] = None,
+                    lazy_depth: int = 2) -> Iterator[OdmlibSchemaValidationError]:
+        """Validate ``odm_file`` in bounded memory and yield every schema error.
+
+        The document is read with a lazy xmlschema resource: it is parsed
+        incrementally, and the subtrees below ``lazy_depth`` are validated and
+        released in turn. With the default depth of 2, memory depends on the
+        size of the largest ``SubjectData`` (or other grandchild of the root)
+        rather than on the size of the file. Elements are parsed with lxml,
+        when it is installed, so that the errors carry line numbers.
+
+        This always uses the xmlschema engine, also for a validator created
+        with ``backend="lxml"``, since libxml2 stops at the first error.
+
+        Args:
+            odm_file: Path or file object of the ODM XML document.
+            max_errors: Stop after yielding this many errors. None (default)
+                yields all errors.
+            lazy_depth: Depth below which elements are released once
+                validated. 1 keeps each child of the root, e.g. the whole
+                ``ClinicalData``, in memory; 2 (default) keeps each
+                ``SubjectData``. Deeper levels are not supported by the
+                identity constraints of the ODM schemas.
+
+        Yields:
+            OdmlibSchemaValidationError: One per schema error, in document
+            order, wrapping the xmlschema error; ``line`` holds its line
+            number when known.
+
+        Example::
+
+            validator = ODMSchemaValidator(standard="odm", version="1.3.2")
+            for error in validator.iter_errors("export.xml", max_errors=100):
+                print(error.line, error.wrapped.reason)
+        """
+        if max_errors is not None and max_errors <= 0:
+            return
+        xsd = self.xsd if self.backend == "xmlschema" else get_compiled_schema(self.xsd_file, self.cache_dir)
+        iterparse = LXML.iterparse if HAS_LXML else None
+        resource = XSD.XMLResource(os.fspath(odm_file) if isinstance(odm_file, os.PathLike) else odm_file,
+                                   lazy=lazy_depth, iterparse=iterparse)
+        try:
+            for count, error in enumerate(xsd.iter_errors(resource), 1):
+                yield OdmlibSchemaValidationError(error)
+                if count == max_errors:
+                    return
+        finally:
+            resource.close()
+
 
 class BaseParser:
     def __init__(self, ns_registry):
@@ -176,6 +419,66 @@ class ODMStringParser(BaseParser, ElementParser):
         return ET.fromstring(self.odm_string)
 
 
+class ODMIterParser(BaseParser):
+    """Incrementally parses an ODM XML file with ``ET.iterparse``.
+
+    Only the subtree of the element currently being yielded is held in memory:
+    every completed element outside a match is cleared and detached from its
+    parent, so very large files (e.g. ClinicalData exports) are processed in
+    bounded memory. There is no ``root`` with the full tree to navigate.
+    """
+
+    def __init__(self, odm_file, namespace_registry=None):
+        self.odm_file = odm_file
+        super().__init__(ns_registry=namespace_registry)
+
+    def iterparse(self, element, ns_prefix="odm"):
+        """Yield each complete XML element named ``element`` in document order.
+
+        A yielded element is cleared and detached once the consumer resumes the
+        generator, so it must be fully processed (e.g. loaded into odmlib)
+        before requesting the next one. Elements of the same name nested inside
+        a yielded element are part of that element's subtree and are not
+        yielded separately.
+
+        :param element: local name of the element to yield, e.g. "SubjectData"
+        :param ns_prefix: registered namespace prefix of ``element`` (default "odm")
+        :return: generator of ET.Element objects
+        :raises OdmlibNamespaceError: (a ValueError) if ``ns_prefix`` is not registered
+        """
+        self.register_namespaces()
+        uri = self.nsr.get_ns_entry_dict(ns_prefix).get(ns_prefix)
+        if uri is None:
+            raise OdmlibNamespaceError(
+                f"Namespace prefix '{ns_prefix}' is not registered",
+                hint=f"Register the prefix before parsing, e.g. NamespaceRegistry(prefix='{ns_prefix}', uri=...)",
+            )
+        return self._iterparse("{" + uri + "}" + element)
+
+    def _iterparse(self, tag):
+        """Yield each complete XML element with the qualified ``tag``; see :meth:`iterparse`."""
+        stack = []
+        in_match = 0
+        for event, elem in ET.iterparse(self.odm_file, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == tag:
+                    in_match += 1
+                continue
+            stack.pop()
+            if elem.tag == tag:
+                in_match -= 1
+                if in_match:
+                    continue
+                yield elem
+            elif in_match:
+                continue
+            # the element is complete and no longer needed: free its subtree and unlink it
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+
 class ODMJSONStringParser:
     def __init__(self, odm_string):
         self.root = json.loads(odm_string)
@@ -22,6 +22,10 @@ The descriptor hierarchy:
     - :class:`ValueSetString` -- combined enumerated + string validator
     - :class:`ODMObject` -- single child ODM element container
     - :class:`ODMListObject` -- list of child ODM elements container
+
+Format patterns are compiled once at import. :data:`FORMAT_CHECKS` maps each
+format descriptor to its check, and :func:`validate_batch` applies a check to
+a whole column of values in one call.
 """
 import odmlib.descriptor as DESC
 import re
@@ -313,6 +317,59 @@ class SizedRegexString(SizedString, Regex):
     pass
 
 
+# Format patterns are compiled once at import; the descriptors below and
+# validate_batch() share them through the _is_* checks and FORMAT_CHECKS.
+_DATETIME_PAT = re.compile(r'^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-(3[01]|0[1-9]|[12][0-9])T'
+                           r'(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-]'
+                           r'(?:2[0-3]|[01][0-9]):[0-5][0-9])?$')
+_PARTIAL_DATETIME_PAT = re.compile(r'^((([0-9][0-9][0-9][0-9])((-(([0][1-9])|([1][0-2])))((-(([0][1-9])|'
+                                   r'([1-2][0-9])|([3][0-1])))(T((([0-1][0-9])|([2][0-3]))((:([0-5][0-9]))(((:'
+                                   r'([0-5][0-9]))((\.[0-9]+)?))?)?)?((((\+|-)(([0-1][0-9])|([2][0-3])):[0-5][0-9])|'
+                                   r'(Z)))?))?)?)?))$')
+_PARTIAL_DATE_PAT = re.compile(r'^(([0-9][0-9][0-9][0-9])(-(([0][1-9])|([1][0-2])))?)$')
+_TIME_PAT = re.compile(r'^(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-]'
+                       r'(?:2[0-3]|[01][0-9]):[0-5][0-9])?$')
+_PARTIAL_TIME_PAT = re.compile(r'^((([0-1][0-9])|([2][0-3]))(:[0-5][0-9])?(((\+|-)(([0-1][0-9])|'
+                               r'([2][0-3])):[0-5][0-9])|(Z))?)$')
+_INCOMPLETE_DATETIME_PAT = re.compile(r'^(((([0-9][0-9][0-9][0-9]))|-)-(((([0][1-9])|([1][0-2])))|-)-(((([0][1-9])|'
+                                      r'([1-2][0-9])|([3][0-1])))|-)T(((([0-1][0-9])|([2][0-3])))|-):(('
+                                      r'([0-5][0-9]))|-):((([0-5][0-9](\.[0-9]+)?))|-)((((\+|-)(([0-1][0-9])|'
+                                      r'([2][0-3])):[0-5][0-9])|Z|-))?)$')
+_INCOMPLETE_DATE_PAT = re.compile(r'^(((([0-9][0-9][0-9][0-9]))|-)-(((([0][1-9])|([1][0-2])))|-)-(((([0][1-9])|'
+                                  r'([1-2][0-9])|([3][0-1])))|-))$')
+_INCOMPLETE_TIME_PAT = re.compile(r'^((((([0-1][0-9])|([2][0-3])))|-):((([0-5][0-9]))|-):((([0-5][0-9]'
+                                  r'(\.[0-9]+)?))|-)((((\+|-)(([0-1][0-9])|([2][0-3])):[0-5][0-9])|Z|-))?)$')
+_DURATION_PAT = re.compile(r'^[+-]?P\d+W$')
+_SAS_NAME_PAT = re.compile("[A-Za-z_][A-Za-z0-9_]*$")
+_SAS_FORMAT_PAT = re.compile("[A-Za-z_$][A-Za-z0-9_.]*$")
+
+
+def _is_date(value):
+    try:
+        datetime.datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        return False
+    return True
+
+
+def _is_partial_date(value):
+    if value and value.count('-') == 2:
+        return _is_date(value)
+    return _PARTIAL_DATE_PAT.match(value) is not None
+
+
+def _is_partial_time(value):
+    return bool(_TIME_PAT.match(value) or _PARTIAL_TIME_PAT.match(value))
+
+
+def _is_sas_name(value):
+    return bool(_SAS_NAME_PAT.match(value)) and len(value) <= 8
+
+
+def _is_sas_format(value):
+    return bool(_SAS_FORMAT_PAT.match(value)) and len(value) <= 8
+
+
 class DateTimeString(DESC.Descriptor):
     """Descriptor for ISO 8601 datetime strings.
 
@@ -322,9 +379,7 @@ class DateTimeString(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        iso_pat = r'^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-(3[01]|0[1-9]|[12][0-9])T(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])?$'
-        pat = re.compile(iso_pat)
-        if (value is not None) and (not pat.match(value)):
+        if (value is not None) and (not _DATETIME_PAT.match(value)):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"Expected type datetime for {self.name}, found value {value}",
@@ -342,9 +397,7 @@ class PartialDateTimeString(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        part_pat = r'^((([0-9][0-9][0-9][0-9])((-(([0][1-9])|([1][0-2])))((-(([0][1-9])|([1-2][0-9])|([3][0-1])))(T((([0-1][0-9])|([2][0-3]))((:([0-5][0-9]))(((:([0-5][0-9]))((\.[0-9]+)?))?)?)?((((\+|-)(([0-1][0-9])|([2][0-3])):[0-5][0-9])|(Z)))?))?)?)?))$'
-        compiled_part_pat = re.compile(part_pat)
-        if (value is not None) and (not compiled_part_pat.match(value)):
+        if (value is not None) and (not _PARTIAL_DATETIME_PAT.match(value)):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"Expected type PartialDateTime for {self.name}, found value {value}",
@@ -363,9 +416,7 @@ class PartialDateString(DESC.Descriptor):
 
     def __set__(self, instance, value):
         if value and value.count('-') == 2:
-            try:
-                datetime.datetime.strptime(value, '%Y-%m-%d')
-            except ValueError:
+            if not _is_date(value):
                 if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                     raise OdmlibValidationError(
                         f"Expected type PartialDate for {self.name}, found value {value}",
@@ -374,9 +425,7 @@ class PartialDateString(DESC.Descriptor):
                         hint="Use YYYY-MM-DD date format",
                     )
         else:
-            part_pat = r'^(([0-9][0-9][0-9][0-9])(-(([0][1-9])|([1][0-2])))?)$'
-            compiled_part_pat = re.compile(part_pat)
-            if (value is not None) and (not compiled_part_pat.match(value)):
+            if (value is not None) and (not _PARTIAL_DATE_PAT.match(value)):
                 if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                     raise OdmlibValidationError(
                         f"Expected type PartialDate for {self.name}, found value {value}",
@@ -394,11 +443,7 @@ class PartialTimeString(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        time_pat = r'^(2[0-3]|[01][0-9]):([0-5][0-9]):([0-5][0-9])(\.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])?$'
-        compiled_time_pat = re.compile(time_pat)
-        part_pat = r'^((([0-1][0-9])|([2][0-3]))(:[0-5][0-9])?(((\+|-)(([0-1][0-9])|([2][0-3])):[0-5][0-9])|(Z))?)$'
-        compiled_part_pat = re.compile(part_pat)
-        if (value is not None) and (not (compiled_time_pat.match(value) or compiled_part_pat.match(value))):
+        if (value is not None) and (not _is_partial_time(value)):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"Expected type IncompleteTime for {self.name}, found value {value}",
@@ -416,9 +461,7 @@ class IncompleteDateTimeString(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        inc_pat = r'^(((([0-9][0-9][0-9][0-9]))|-)-(((([0][1-9])|([1][0-2])))|-)-(((([0][1-9])|([1-2][0-9])|([3][0-1])))|-)T(((([0-1][0-9])|([2][0-3])))|-):((([0-5][0-9]))|-):((([0-5][0-9](\.[0-9]+)?))|-)((((\+|-)(([0-1][0-9])|([2][0-3])):[0-5][0-9])|Z|-))?)$'
-        compiled_inc_pat = re.compile(inc_pat)
-        if (value is not None) and (not compiled_inc_pat.match(value)):
+        if (value is not None) and (not _INCOMPLETE_DATETIME_PAT.match(value)):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"Expected type IncompleteDateTime for {self.name}, found value {value}",
@@ -436,9 +479,7 @@ class IncompleteDateString(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        inc_pat = r'^(((([0-9][0-9][0-9][0-9]))|-)-(((([0][1-9])|([1][0-2])))|-)-(((([0][1-9])|([1-2][0-9])|([3][0-1])))|-))$'
-        compiled_inc_pat = re.compile(inc_pat)
-        if (value is not None) and (not compiled_inc_pat.match(value)):
+        if (value is not None) and (not _INCOMPLETE_DATE_PAT.match(value)):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"Expected type IncompleteDate for {self.name}, found value {value}",
@@ -456,9 +497,7 @@ class IncompleteTimeString(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        inc_pat = r'^((((([0-1][0-9])|([2][0-3])))|-):((([0-5][0-9]))|-):((([0-5][0-9](\.[0-9]+)?))|-)((((\+|-)(([0-1][0-9])|([2][0-3])):[0-5][0-9])|Z|-))?)$'
-        compiled_inc_pat = re.compile(inc_pat)
-        if (value is not None) and (not compiled_inc_pat.match(value)):
+        if (value is not None) and (not _INCOMPLETE_TIME_PAT.match(value)):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"Expected type IncompleteTime for {self.name}, found value {value}",
@@ -469,9 +508,6 @@ class IncompleteTimeString(DESC.Descriptor):
         super().__set__(instance, value)
 
 
-_DURATION_PAT = re.compile(r'^[+-]?P\d+W$')
-
-
 class DurationDateTimeString(DESC.Descriptor):
     """Descriptor for ISO 8601 duration strings (week-based).
 
@@ -498,10 +534,7 @@ class DateString(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        try:
-            if value is not None:
-                datetime.datetime.strptime(value, '%Y-%m-%d')
-        except ValueError:
+        if (value is not None) and not _is_date(value):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"Expected type date (YYYY-MM-DD) for {self.name}, found value {value}",
@@ -521,8 +554,7 @@ class SASName(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        pat = re.compile("[A-Za-z_][A-Za-z0-9_]*$")
-        if (value is not None) and (not pat.match(value) or len(value) > 8):
+        if (value is not None) and not _is_sas_name(value):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"{self.name} has an invalid sasName of {value}",
@@ -543,8 +575,7 @@ class SASFormat(DESC.Descriptor):
     """
 
     def __set__(self, instance, value):
-        pat = re.compile("[A-Za-z_$][A-Za-z0-9_.]*$")
-        if (value is not None) and (not pat.match(value) or len(value) > 8):
+        if (value is not None) and not _is_sas_format(value):
             if not _mode.is_permissive(_mode.ValidationMode.SKIP_FORMAT):
                 raise OdmlibValidationError(
                     f"{self.name} has an invalid sasFormat of {value}",
@@ -610,19 +641,104 @@ class FileName(DESC.Descriptor):
         super().__set__(instance, value)
 
 
+#: Format check used by each format-validating descriptor type. Each check takes
+#: a non-None value and returns a truthy result when the value is valid.
+FORMAT_CHECKS = {
+    DateTimeString: _DATETIME_PAT.match,
+    PartialDateTimeString: _PARTIAL_DATETIME_PAT.match,
+    PartialDateString: _is_partial_date,
+    PartialTimeString: _is_partial_time,
+    IncompleteDateTimeString: _INCOMPLETE_DATETIME_PAT.match,
+    IncompleteDateString: _INCOMPLETE_DATE_PAT.match,
+    IncompleteTimeString: _INCOMPLETE_TIME_PAT.match,
+    DurationDateTimeString: _DURATION_PAT.match,
+    DateString: _is_date,
+    SASName: _is_sas_name,
+    SASFormat: _is_sas_format,
+    Email: valid_email,
+    Url: valid_url,
+    FileName: is_valid_filename,
+}
+
+
+def validate_batch(descriptor, values):
+    """Validate a column of values against a descriptor's format in one call.
+
+    Applies the same compiled check the descriptor runs on assignment, e.g.
+    to all ``DateTimeStamp`` values of the AuditRecords in a ClinicalData
+    block, without creating any odmlib objects. ``None`` values are skipped,
+    as they are on assignment.
+
+    Args:
+        descriptor: A format descriptor class (e.g. :class:`DateTimeString`)
+            or a descriptor instance read from a model class
+            (e.g. ``ODM.ODM.CreationDateTime``).
+        values (Iterable[str]): The values to check.
+
+    Returns:
+        list: ``(position, value)`` for each invalid value, in input order.
+
+    Raises:
+        OdmlibTypeError: If the descriptor type has no registered format check.
+
+    Example::
+
+        bad = validate_batch(T.DateTimeString, timestamps)
+    """
+    descriptor_class = descriptor if isinstance(descriptor, type) else type(descriptor)
+    check = next((FORMAT_CHECKS[cls] for cls in descriptor_class.__mro__ if cls in FORMAT_CHECKS), None)
+    if check is None:
+        raise OdmlibTypeError(
+            f"No format check is registered for {descriptor_class.__name__}",
+            expected_type="format descriptor",
+            actual_value=descriptor,
+            hint=f"Use one of: {', '.join(cls.__name__ for cls in FORMAT_CHECKS)}",
+        )
+    return [(i, value) for i, value in enumerate(values) if value is not None and not check(value)]
+
+
 class ValidValues(DESC.Descriptor):
     """Descriptor that validates against a dynamically-loaded set of permitted values.
 
     Looks up valid values from the ValueSet registry using the element
-    class name and attribute name (e.g., ``ODM.FileType``).
+    class name and attribute name (e.g., ``ODM.FileType``). The valueset
+    version and membership index are bound once per model class (see
+    :meth:`bind`), so each assignment is a single membership test.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bound = {}
+
+    def bind(self, owner):
+        """Resolve the valueset version for ``owner`` and compile its membership index.
+
+        Called by :class:`~odmlib.odm_element.ODMMeta` when the model class is
+        created, and on first assignment for subclasses that inherit this
+        descriptor.
+
+        Args:
+            owner (type): The model class the value is set on.
+
+        Returns:
+            tuple: ``(version, index)`` where ``index`` supports ``value in index``.
+        """
+        version = VS.ValueSetLoader.get_version_for_module(owner.__module__, instance_class=owner)
+        bound = (version, VS.ValueSet.member_index(owner.__name__ + "." + self.name, version))
+        self._bound[owner] = bound
+        return bound
+
     def __set__(self, instance, value):
         if (value is not None):
-            attr_key = type(instance).__name__ + "." + self.name
-            if not VS.ValueSet.validate(attr_key, value, instance=instance):
+            bound = self._bound.get(type(instance)) or self.bind(type(instance))
+            try:
+                valid = value in bound[1]
+            except TypeError:
+                valid = False
+            if not valid:
                 if not _mode.is_permissive(_mode.ValidationMode.SKIP_VALUESET):
-                    description = VS.ValueSet.describe(attr_key, instance=instance)
+                    attr_key = type(instance).__name__ + "." + self.name
+                    description = VS.ValueSet.describe(attr_key, version=bound[0])
                     raise OdmlibTypeError(
                         f"Invalid value {value} for {self.name}. {description}",
                         attribute=self.name,
@@ -23,6 +23,18 @@ class _UnknownAttribute:
 UNKNOWN_ATTRIBUTE = _UnknownAttribute()
 
 
+class _PatternIndex:
+    """Membership index for a regex valueset entry: ``value in index`` is a full match."""
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+    def __contains__(self, value):
+        return self.pattern.fullmatch(value) is not None
+
+
 class ValueSetLoader:
     """Loads and caches valueset data from JSON file"""
     _cache = None  # Class variable for singleton cache
@@ -115,6 +127,7 @@ class ValueSet:
     UNKNOWN_ATTRIBUTE = UNKNOWN_ATTRIBUTE
 
     _compiled_regex_cache = {}  # (version, attribute) -> compiled re.Pattern
+    _member_index_cache = {}  # (version, attribute) -> frozenset or _PatternIndex
 
     # Versions tried (in order) when an attribute is missing from the resolved
     # version. Hybrid local models (e.g. an ODM 1.3.2 base extended with
@@ -192,6 +205,41 @@ class ValueSet:
         # (Unknown *version* still raises, above.)
         return UNKNOWN_ATTRIBUTE
 
+    @classmethod
+    def member_index(cls, attribute, version):
+        """
+        Get the precompiled membership index for an attribute.
+
+        The index is built once per (version, attribute) and supports
+        ``value in index``: a frozenset for list entries, a compiled full-match
+        pattern for regex entries, and an empty frozenset for an unknown
+        attribute.
+
+        Args:
+            attribute: "ClassName.AttributeName" format
+            version: Resolved version (e.g., "odm_2_0")
+
+        Returns:
+            frozenset or _PatternIndex: The membership index.
+
+        Raises:
+            OdmlibValidationError: If the *version* is not found in the valueset.
+        """
+        cache_key = (version, attribute)
+        index = cls._member_index_cache.get(cache_key)
+        if index is None:
+            entry = cls.value_set(attribute, version=version)
+            if isinstance(entry, list):
+                index = frozenset(entry)
+            elif isinstance(entry, dict) and "_regex" in entry:
+                if cache_key not in cls._compiled_regex_cache:
+                    cls._compiled_regex_cache[cache_key] = re.compile(entry["_regex"])
+                index = _PatternIndex(cls._compiled_regex_cache[cache_key])
+            else:
+                index = frozenset()
+            cls._member_index_cache[cache_key] = index
+        return index
+
     @classmethod
     def validate(cls, attribute, value, version=None, instance=None):
         """
@@ -207,28 +255,14 @@ class ValueSet:
             bool: True if the value is valid, False otherwise.
         """
         version = cls._resolve_version(version, instance)
-        entry = cls.value_set(attribute, version=version)
-
-        if entry is UNKNOWN_ATTRIBUTE:
-            # No registered value set for this attribute: not provably
-            # valid -> False. This lets ValidValues.__set__ reach the
-            # SKIP_VALUESET permissive guard instead of the old raise
-            # propagating out of value_set().
+        # an unknown attribute has an empty index: not provably valid -> False,
+        # so ValidValues.__set__ can reach the SKIP_VALUESET permissive guard
+        try:
+            return value in cls.member_index(attribute, version)
+        except TypeError:
+            # unhashable value, or a non-string value for a regex entry
             return False
 
-        if isinstance(entry, list):
-            return value in entry
-
-        # Regex dict entry
-        if isinstance(entry, dict) and "_regex" in entry:
-            cache_key = (version, attribute)
-            if cache_key not in cls._compiled_regex_cache:
-                cls._compiled_regex_cache[cache_key] = re.compile(entry["_regex"])
-            pattern = cls._compiled_regex_cache[cache_key]
-            return pattern.fullmatch(value) is not None
-
-        return False
-
     @classmethod
     def describe(cls, attribute, version=None, instance=None):
         """
@@ -0,0 +1,342 @@
+"""Iterative tree walking for odmlib object hierarchies.
+
+:func:`walk` traverses an odmlib element and all of its descendants
+depth-first with an explicit stack, so deep documents do not run into the
+Python recursion limit. Each element is visited once, and every visitor
+passed to the same :func:`walk` call sees it in that single traversal::
+
+    idx = OIDIndex()
+    builder = DictBuilder()
+    walk(odm, OIDIndexVisitor(idx), builder)
+    odm_dict = builder.result
+
+Children are the values of the element's declared child element attributes
+(``_elems``) and are visited in instance ``__dict__`` order, the order used by
+:meth:`~odmlib.odm_element.ODMElement.to_dict`. The visitors below implement
+``to_dict``, ``build_oid_index``, ``verify_oids`` and ``verify_order`` on
+:class:`~odmlib.odm_element.ODMElement`.
+"""
+from __future__ import annotations
+from typing import Any, Optional, Tuple
+import odmlib.odm_element as OE
+from odmlib.exceptions import OdmlibError, OdmlibElementOrderError
+
+# class-level bookkeeping names that are never part of an element's content
+_INTERNAL_NAMES = frozenset(("_fields", "_attr_ns", "_elems", "_attrs"))
+
+
+class ODMVisitor:
+    """Base class for visitors run by :func:`walk`.
+
+    Subclasses override :meth:`enter`, and :meth:`leave` when they need
+    post-order processing. Raising from either method stops the walk.
+    """
+
+    def enter(self, odm_obj: Any, name: Optional[str]) -> None:
+        """Called when ``odm_obj`` is reached, before any of its children.
+
+        Args:
+            odm_obj: The odmlib element being visited.
+            name (Optional[str]): The attribute holding ``odm_obj`` in its
+                parent, or None for the root of the walk.
+        """
+
+    def leave(self, odm_obj: Any) -> None:
+        """Called after all children of ``odm_obj`` have been visited.
+
+        Args:
+            odm_obj: The odmlib element being left.
+        """
+
+
+_LEAVE = object()
+
+
+def walk(root: Any, *visitors: ODMVisitor) -> None:
+    """Visit ``root`` and all descendants depth-first, calling every visitor on each element.
+
+    Args:
+        root: The odmlib element at which to start.
+        *visitors: One or more :class:`ODMVisitor` instances, called in the
+            order given for each element.
+    """
+    element_class = OE.ODMElement
+    enters = [visitor.enter for visitor in visitors]
+    # skip the call for visitors that do not override leave
+    leaves = [visitor.leave for visitor in visitors if type(visitor).leave is not ODMVisitor.leave]
+    stack = [(root, None)]
+    while stack:
+        odm_obj, name = stack.pop()
+        if odm_obj is _LEAVE:
+            for leave in leaves:
+                leave(name)
+            continue
+        for enter in enters:
+            enter(odm_obj, name)
+        if leaves:
+            stack.append((_LEAVE, odm_obj))
+        # children are pushed in reverse so that they are popped in __dict__ order
+        elems = odm_obj._elems
+        children = []
+        for attr, obj in odm_obj.__dict__.items():
+            if attr in elems:
+                if isinstance(obj, element_class):
+                    children.append((obj, attr))
+                elif isinstance(obj, list):
+                    children.extend([(o, attr) for o in obj])
+        children.reverse()
+        stack.extend(children)
+
+
+def shallow_dict(odm_obj: Any) -> Tuple[dict, list]:
+    """Return the dictionary content of a single element, without descending into its children.
+
+    The dictionary matches what :meth:`~odmlib.odm_element.ODMElement.to_dict`
+    produces for ``odm_obj``, except that each child element is an empty dict.
+
+    Args:
+        odm_obj: An odmlib element.
+
+    Returns:
+        tuple: ``(property_dict, children)`` where ``children`` lists
+        ``(name, child_dict)`` for each child element in :func:`walk` order.
+    """
+    property_dict = {}
+    children = []
+    elems = odm_obj._elems
+    for attr, obj in odm_obj.__dict__.items():
+        if attr in elems and isinstance(obj, list):
+            property_dict[attr] = dicts = [{} for _ in obj]        # list of ELEMENTS
+            children.extend([(attr, child_dict) for child_dict in dicts])
+        elif attr in elems and isinstance(obj, OE.ODMElement):
+            property_dict[attr] = child_dict = {}                  # element
+            children.append((attr, child_dict))
+        elif obj is not None and attr not in _INTERNAL_NAMES:
+            property_dict[attr] = obj                              # attributes
+    return property_dict, children
+
+
+class DictBuilder(ODMVisitor):
+    """Builds the dictionary serialization of the walked hierarchy.
+
+    Keys follow ``__dict__`` order and attributes set to None are omitted.
+    Each element's dictionary is created, empty, when its parent is visited
+    and is filled in when the element itself is visited; the pending
+    dictionaries are kept on a stack that mirrors the one in :func:`walk`.
+    The dictionary for the walk root is available as :attr:`result`.
+    """
+
+    def __init__(self) -> None:
+        self.result: dict = {}
+        self._stack: list = [self.result]
+
+    def enter(self, odm_obj, name):
+        # same content as shallow_dict(), filled into the pending dict without building the child list
+        property_dict = self._stack.pop()
+        child_dicts = []
+        elems = odm_obj._elems
+        for attr, obj in odm_obj.__dict__.items():
+            if attr in elems and isinstance(obj, list):
+                property_dict[attr] = dicts = [{} for _ in obj]     # list of ELEMENTS
+                child_dicts.extend(dicts)
+            elif attr in elems and isinstance(obj, OE.ODMElement):
+                property_dict[attr] = element_dict = {}             # element
+                child_dicts.append(element_dict)
+            elif obj is not None and attr not in _INTERNAL_NAMES:
+                property_dict[attr] = obj                           # attributes
+        child_dicts.reverse()
+        self._stack.extend(child_dicts)
+
+
+class OIDIndexVisitor(ODMVisitor):
+    """Adds every OID-valued attribute to an :class:`~odmlib.oid_index.OIDIndex`.
+
+    Args:
+        idx (OIDIndex): The index to populate.
+    """
+
+    def __init__(self, idx: Any) -> None:
+        self.idx = idx
+
+    def enter(self, odm_obj, name):
+        for attr, obj in odm_obj.__dict__.items():
+            if "OID" in attr and attr not in odm_obj._elems:
+                self.idx.add_oid(obj, odm_obj)
+
+
+class OIDCheckVisitor(ODMVisitor):
+    """Registers OID definitions and references with an OID checker.
+
+    ``OID`` attributes are definitions; other attributes whose name contains
+    ``OID`` are references. The checker raises on duplicate definitions.
+
+    Args:
+        oid_checker: An ``OIDRef`` or ``DynamicOIDRef`` instance.
+    """
+
+    def __init__(self, oid_checker: Any) -> None:
+        self.oid_checker = oid_checker
+
+    def enter(self, odm_obj, name):
+        for attr, obj in odm_obj.__dict__.items():
+            # assumes consistency in OID naming. Exceptions: FileOID and PriorFileOID in ODM
+            if "OID" not in attr or attr in odm_obj._elems:
+                continue
+            if attr == "OID":
+                self.oid_checker.add_oid(obj, odm_obj.__class__.__name__)
+            else:
+                self.oid_checker.add_oid_ref(obj, attr)
+
+
+def order_error(odm_obj: Any) -> Optional[OdmlibElementOrderError]:
+    """Return the element order error for ``odm_obj``'s own children, or None if they are in order.
+
+    Args:
+        odm_obj: An odmlib element.
+
+    Returns:
+        Optional[OdmlibElementOrderError]: The error describing the expected order.
+    """
+    obj_list = [key for key in odm_obj.__dict__ if key != "_content" and key not in odm_obj._attrs]
+    elem_list = [elem for elem in odm_obj._elems if elem in obj_list]
+    if obj_list != elem_list:
+        return OdmlibElementOrderError(
+            f"The order of elements in {odm_obj.__class__.__name__} should be "
+            f"{', '.join(key for key in odm_obj._elems.keys())}",
+            element_type=odm_obj.__class__.__name__,
+            hint="Use reorder_object() to fix element ordering automatically",
+        )
+    return None
+
+
+class OrderVisitor(ODMVisitor):
+    """Raises :exc:`~odmlib.exceptions.OdmlibElementOrderError` at the first element
+    whose children are not in model declaration order."""
+
+    def enter(self, odm_obj, name):
+        error = order_error(odm_obj)
+        if error is not None:
+            raise error
+
+
+class ConformanceVisitor(ODMVisitor):
+    """Checks each element with a checker that validates odmlib objects directly.
+
+    Args:
+        conformance_checker: An object with a ``check_element(odm_obj)``
+            method, e.g. :class:`~odmlib.conformance.ModelConformanceChecker`,
+            that raises for a nonconforming element.
+    """
+
+    def __init__(self, conformance_checker: Any) -> None:
+        self.check_element = conformance_checker.check_element
+
+    def enter(self, odm_obj, name):
+        self.check_element(odm_obj)
+
+
+class ValidationVisitor(ODMVisitor):
+    """Checks element order, OIDs and conformance of every element in one walk.
+
+    The first error of each kind is recorded, and the remaining checks of
+    that kind are skipped. Conformance is checked one element at a time when
+    the checker supports it: on the objects themselves for a checker with
+    ``check_element`` (e.g.
+    :class:`~odmlib.conformance.ModelConformanceChecker`), or against the
+    schema nested in the parent's schema, from shallow dictionaries, for a
+    checker with ``check_element_conformance`` (e.g.
+    :class:`~odmlib.odm_1_3_2.rules.metadata_schema.MetadataSchema`).
+    Otherwise :meth:`errors` falls back to a whole-document
+    ``verify_conformance`` call after the walk.
+
+    Args:
+        oid_checker: Optional ``OIDRef`` or ``DynamicOIDRef`` instance.
+        conformance_checker: Optional conformance checker.
+        fail_fast (bool): If True, raise an element order error as soon as it
+            is found. Order errors take precedence over the other kinds, so
+            the rest of the walk cannot change the outcome.
+    """
+
+    def __init__(self, oid_checker: Any = None, conformance_checker: Any = None, fail_fast: bool = False) -> None:
+        self.fail_fast = fail_fast
+        self.order_error: Optional[Exception] = None
+        self.oid_error: Optional[Exception] = None
+        self.conformance_error: Optional[Exception] = None
+        self.oid_checker = oid_checker
+        self._oid_visitor = OIDCheckVisitor(oid_checker) if oid_checker else None
+        self.conformance_checker = conformance_checker
+        self._check_element = getattr(conformance_checker, "check_element", None)
+        self._per_element = self._check_element is not None or \
+            hasattr(conformance_checker, "check_element_conformance")
+        self._schemas: list = []
+        self._root = None
+
+    def enter(self, odm_obj, name):
+        if self._root is None:
+            self._enter_root(odm_obj)
+        self._check_order(odm_obj)
+        self._check_oids(odm_obj, name)
+        if self._check_element is not None:
+            self._check_model_conformance(odm_obj)
+        elif self._per_element:
+            self._check_conformance(odm_obj)
+
+    def _enter_root(self, odm_obj):
+        self._root = odm_obj
+        if self._per_element and self._check_element is None:
+            try:
+                self._schemas.append(self.conformance_checker.element_schema(type(odm_obj).__name__))
+            except OdmlibError as e:
+                self.conformance_error = e
+                self._per_element = False
+
+    def _check_order(self, odm_obj):
+        if self.order_error is None:
+            self.order_error = order_error(odm_obj)
+            if self.order_error is not None and self.fail_fast:
+                raise self.order_error
+
+    def _check_oids(self, odm_obj, name):
+        if self._oid_visitor is not None and self.oid_error is None:
+            try:
+                self._oid_visitor.enter(odm_obj, name)
+            except OdmlibError as e:
+                self.oid_error = e
+
+    def _check_model_conformance(self, odm_obj):
+        if self.conformance_error is None:
+            try:
+                self._check_element(odm_obj)
+            except OdmlibError as e:
+                self.conformance_error = e
+
+    def _check_conformance(self, odm_obj):
+        schema = self._schemas.pop()
+        property_dict, children = shallow_dict(odm_obj)
+        child_schemas = {}
+        if schema is not None and self.conformance_error is None:
+            try:
+                child_schemas = self.conformance_checker.check_element_conformance(
+                    property_dict, schema, type(odm_obj).__name__)
+            except OdmlibError as e:
+                self.conformance_error = e
+        self._schemas.extend([child_schemas.get(attr) for attr, _ in reversed(children)])
+
+    def errors(self) -> list:
+        """Finish the checks that need the whole document and return the recorded errors.
+
+        Returns:
+            list: Order, OID and conformance errors, in that order; empty if
+            the document is valid.
+        """
+        if self.oid_checker and self.oid_error is None:
+            try:
+                self.oid_checker.check_oid_refs()
+            except OdmlibError as e:
+                self.oid_error = e
+        if self.conformance_checker and not self._per_element and self.conformance_error is None:
+            try:
+                self._root.verify_conformance(self.conformance_checker)
+            except OdmlibError as e:
+                self.conformance_error = e
+        return [e for e in (self.order_error, self.oid_error, self.conformance_error) if e is not None]
@@ -0,0 +1,154 @@
+"""
+This module contains a small runner for pipelines of stages with declared inputs and outputs.
+
+Stages whose inputs are available run concurrently in threads, and the outputs of cacheable stages
+are stored in a content-addressed cache, so that a stage whose inputs did not change is not run again.
+"""
+import os
+import pickle
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from utilities.utils import content_hash
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    """
+    One step of a Pipeline.
+
+    Args:
+        name (str): The name of the stage; part of the cache key, so two stages must not share a name.
+        func (callable): Called with the values of the inputs as positional arguments, in the order of inputs.
+            It returns the value of the output, or a tuple with one value per output when there are several.
+        inputs (tuple): The names of the values the stage needs: pipeline inputs or outputs of other stages.
+        outputs (tuple): The names of the values the stage produces; empty for a stage that only writes files.
+        cache (bool): Store the outputs in the cache of the pipeline and reuse them while the inputs do not change.
+            Only for stages without side effects whose inputs are DataFrames, bytes, file paths or values
+            that str() identifies (see utilities.utils.content_hash).
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), cache=True):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.cache = cache
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, inputs={self.inputs}, outputs={self.outputs})"
+
+
+class Pipeline:
+    """
+    Runs stages in the order of their data dependencies, running independent stages at the same time.
+
+    Args:
+        stages (list): The stages. Each output name must be produced by one stage only.
+        cache_dir (str | Path, optional): Directory of the content-addressed cache. When None, nothing is cached.
+        salt (str, optional): Mixed into every cache key, e.g. a hash of the code the stages run, so that
+            cached outputs are not reused after that code changes.
+        max_workers (int, optional): The maximum number of stages that run at the same time.
+    """
+
+    def __init__(self, stages, cache_dir=None, salt="", max_workers=None):
+        self.stages = list(stages)
+        self.cache_dir = cache_dir
+        self.salt = salt
+        self.max_workers = max_workers
+        producers = {}
+        for stage in self.stages:
+            for output in stage.outputs:
+                if output in producers:
+                    raise ValueError(f"Output {output!r} is produced by stages {producers[output]!r} and "
+                                     f"{stage.name!r}")
+                producers[output] = stage.name
+
+    def run(self, **inputs):
+        """
+        Runs all stages.
+
+        Args:
+            **inputs: The values the stages need that no stage produces.
+        Returns:
+            dict: The inputs and the outputs of all stages, keyed by name.
+        Raises:
+            ValueError: If a stage needs a value that is neither an input nor the output of a stage.
+            Any exception raised by a stage; the stages that are running are completed first.
+        """
+        values = dict(inputs)
+        pending = list(self.stages)
+        running = {}
+        reused = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for stage in [stage for stage in pending if all(name in values for name in stage.inputs)]:
+                    pending.remove(stage)
+                    args = [values[name] for name in stage.inputs]
+                    running[executor.submit(self._run_stage, stage, args)] = stage
+                if not running:
+                    missing = sorted({name for stage in pending for name in stage.inputs} - values.keys())
+                    raise ValueError(f"No input or stage provides {missing}, needed by "
+                                     f"{[stage.name for stage in pending]}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    outputs, cached = future.result()
+                    values.update(zip(stage.outputs, outputs))
+                    if cached:
+                        reused.append(stage.name)
+        if reused:
+            logger.info(f"Reused the cached outputs of {', '.join(reused)}")
+        return values
+
+    def _run_stage(self, stage, args):
+        """
+        Returns the outputs of a stage as a tuple, and whether they were read from the cache.
+        """
+        cache_file = None
+        if stage.cache and self.cache_dir is not None:
+            key = content_hash(self.salt, stage.name, *args)
+            cache_file = os.path.join(self.cache_dir, key[:2], f"{key}.pickle")
+            outputs = self._read_cache(cache_file)
+            if outputs is not None:
+                return outputs, True
+
+        start = time.perf_counter()
+        result = stage.func(*args)
+        logger.debug(f"Stage {stage.name} completed in {time.perf_counter() - start:.3f}s")
+        if len(stage.outputs) == 0:
+            outputs = ()
+        elif len(stage.outputs) == 1:
+            outputs = (result,)
+        else:
+            outputs = tuple(result)
+
+        if cache_file is not None:
+            self._write_cache(cache_file, outputs)
+        return outputs, False
+
+    @staticmethod
+    def _read_cache(cache_file):
+        """
+        Returns the outputs stored in a cache file, or None when there is no usable cache file.
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable stage cache file {cache_file}: {e}")
+            return None
+
+    @staticmethod
+    def _write_cache(cache_file, outputs):
+        """
+        Stores the outputs of a stage; the cache file is replaced only when it is complete.
+        """
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_cache_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_cache_file, "wb") as f:
+            pickle.dump(outputs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_cache_file, cache_file)
@@ -3,8 +3,15 @@ This module contains utility functions
 that can be reused.
 """
 import os
+import hashlib
+import io
+import json
+import pandas as pd
+import requests
+from urllib.parse import urlsplit
 from odmlib import odm_parser as P
 from odmlib import odm_loader as OL, loader as LO
+from odmlib.exceptions import OdmlibSchemaValidationError
 import xmlschema as XSD
 from lxml import etree
 from saxonche import PySaxonProcessor
@@ -12,11 +19,20 @@ from dominate import document
 from dominate.tags import *
 import logging
 import zipfile
-import tempfile
+import shutil
+import threading
+import time
+from pathlib import Path
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow  # noqa: F401  enables the Parquet format of the metadata cache
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 def create_directory(directory_path):
     if not os.path.exists(directory_path):
@@ -27,17 +43,174 @@ def create_directory(directory_path):
         logger.error(f"Error creating directory: {e}")
 
 
-def validate_odm_xml_file(odm_file, schema_file, verbose=False):
-    validator = P.ODMSchemaValidator(schema_file)
+def read_source_bytes(source):
+    """
+    Returns the content of a local file, or of an https URL.
+
+    Args:
+        source (str): Path to the file, or https URL.
+    """
+    source = str(source)
+    if source.startswith("https"):
+        response = requests.get(source)
+        response.raise_for_status()
+        return response.content
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def read_excel_cached(source, sheet_name, cache_dir=None, **kwargs):
+    """
+    Reads an Excel sheet into a DataFrame, using a columnar cache of previously parsed sheets.
+
+    The cache key is the SHA-256 hash of the workbook content, the sheet name, the read options and the
+    pandas version, so an edited or re-downloaded workbook is parsed again. The parsed sheet is stored
+    as Parquet when pyarrow is installed and the sheet has one type per column, and as a pickle otherwise.
+
+    Args:
+        source (str): Path to the Excel file, or https URL.
+        sheet_name (str): Name of the sheet to read.
+        cache_dir (str, optional): Directory of the cache. When None, the sheet is always parsed.
+        **kwargs: Options passed to pandas.read_excel, e.g. keep_default_na=False.
+
+    Returns:
+        pd.DataFrame: The sheet content.
+    """
+    content = read_source_bytes(source)
+    if cache_dir is None:
+        return pd.read_excel(io.BytesIO(content), sheet_name=sheet_name, **kwargs)
+
+    digest = hashlib.sha256(content)
+    digest.update(_stable_repr((sheet_name, kwargs, pd.__version__)).encode("utf-8"))
+    cache_path = os.path.join(cache_dir, digest.hexdigest()[:32])
+    for extension, read_cache in ((".parquet", pd.read_parquet), (".pkl", pd.read_pickle)):
+        if os.path.exists(cache_path + extension):
+            try:
+                return read_cache(cache_path + extension)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable metadata cache file {cache_path + extension}: {e}")
+
+    df = pd.read_excel(io.BytesIO(content), sheet_name=sheet_name, **kwargs)
+    _write_metadata_cache(df, cache_path)
+    return df
+
+
+def _stable_repr(value):
+    """repr() of read options that is the same in every run: functions and types are shown by name."""
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{key!r}: {_stable_repr(item)}" for key, item in sorted(value.items())) + "}"
+    if isinstance(value, (list, tuple)):
+        return "(" + ", ".join(_stable_repr(item) for item in value) + ")"
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+def _write_metadata_cache(df, cache_path):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        if HAS_PYARROW:
+            try:
+                df.to_parquet(temp_path)
+                os.replace(temp_path, cache_path + ".parquet")
+                return
+            except (ValueError, TypeError):
+                # mixed-type columns, e.g. numbers and empty strings, cannot be stored as Parquet
+                pass
+        df.to_pickle(temp_path)
+        os.replace(temp_path, cache_path + ".pkl")
+    except OSError as e:
+        logger.warning(f"Could not write metadata cache file {cache_path}: {e}")
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+# field separators of the delimited metadata formats, by file extension; None lets pandas detect it
+DELIMITED_SEPARATORS = {".csv": ",", ".tsv": "\t", ".tab": "\t", ".txt": None}
+
+
+def read_metadata_table(source, sheet_name=None, columns=None, converters=None, cache_dir=None):
+    """
+    Reads a metadata table from an Excel sheet, or from a CSV or other delimited text file.
+
+    The format is chosen by the extension of the path or URL: .csv, .tsv, .tab and .txt files are read
+    as delimited text, anything else as an Excel workbook through read_excel_cached. Empty cells are
+    read as empty strings in both cases.
+
+    Args:
+        source (str): Path to the file, or https URL.
+        sheet_name (str, optional): Name of the Excel sheet; ignored for delimited files.
+        columns (dict, optional): The columns to load, mapped to their dtype, e.g. str or "category"; None
+            keeps the inferred dtype. Other columns are not loaded. When omitted, all columns are loaded.
+        converters (dict, optional): Functions that convert the cells of a column, by column name. A column
+            with a converter must also be listed in columns.
+        cache_dir (str, optional): Directory of the parsed-sheet cache used for Excel workbooks.
+
+    Returns:
+        pd.DataFrame: The table, with its columns in file order.
+    """
+    converters = converters or {}
+    read_options = {"keep_default_na": False, "converters": converters}
+    if columns is not None:
+        read_options["usecols"] = list(columns)
+        read_options["dtype"] = {name: dtype for name, dtype in columns.items()
+                                 if dtype is not None and name not in converters}
+
+    extension = os.path.splitext(urlsplit(str(source)).path)[1].lower()
+    if extension in DELIMITED_SEPARATORS:
+        separator = DELIMITED_SEPARATORS[extension]
+        return pd.read_csv(io.BytesIO(read_source_bytes(source)), sep=separator,
+                           engine="c" if separator else "python", **read_options)
+    return read_excel_cached(source, sheet_name, cache_dir=cache_dir, engine='openpyxl', **read_options)
+
+
+def validate_odm_xml_file(odm_file, schema_file, verbose=False, cache_dir=None, backend="xmlschema"):
+    """
+    Validates an ODM XML file against an XML schema and logs any validation errors.
+
+    The compiled schema is cached for the rest of the process, and in cache_dir when given,
+    so that repeated validations do not recompile the XSD files.
+
+    Args:
+        odm_file (str): Path to the ODM XML file.
+        schema_file (str): Path to the main XSD file.
+        verbose (bool): Log a message when the validation succeeds.
+        cache_dir (str, optional): Directory for the on-disk cache of compiled schemas.
+        backend (str): "xmlschema" for detailed error paths, or "lxml" for faster validation with libxml2.
+    """
+    validator = P.ODMSchemaValidator(schema_file, cache_dir=cache_dir, backend=backend)
     try:
         validator.validate_file(odm_file)
-    except XSD.validators.exceptions.XMLSchemaChildrenValidationError as ve:
+    except (OdmlibSchemaValidationError, XSD.XMLSchemaValidationError) as ve:
         logger.error(f"schema validation errors: {ve}")
     else:
         if verbose:
             logger.info("ODM XML schema validation completed successfully...")
 
 
+def validate_odm_xml_bytes(odm_xml, schema_file, cache_dir=None, backend="xmlschema"):
+    """
+    Validates an in-memory ODM XML document against an XML schema.
+
+    Unlike validate_odm_xml_file, the first validation error is raised instead of logged.
+
+    Args:
+        odm_xml (bytes): UTF-8 encoded ODM XML document.
+        schema_file (str): Path to the main XSD file.
+        cache_dir (str, optional): Directory for the on-disk cache of compiled schemas.
+        backend (str): "xmlschema" for detailed error paths, or "lxml" for faster validation with libxml2.
+    Returns:
+        bool: True, as the document is valid.
+    Raises:
+        OdmlibSchemaValidationError: If the document is not valid.
+    """
+    validator = P.ODMSchemaValidator(schema_file, cache_dir=cache_dir, backend=backend)
+    validator.validate_file(io.BytesIO(odm_xml))
+    return True
+
+
 def transform_xml(xml_path, xsl_path, output_path):
     """
     Transforms an XML file using an XSLT stylesheet.
@@ -60,24 +233,139 @@ def transform_xml(xml_path, xsl_path, output_path):
         print(etree.tostring(result_tree).decode())
 
 
-def transform_xml_saxonche(file_path, xsl_path, output_path, **kwargs):
+class SaxonTransformer:
+    """
+    Keeps one Saxon-HE processor and the compiled XSLT stylesheets alive across transformations.
+
+    Stylesheets are compiled once per set of stylesheet parameters and reused until the stylesheet
+    file changes. Compiling and caching a stylesheet is serialized by a lock, and each set of
+    parameters has its own compiled stylesheet, so transformations with different parameters can run
+    in different threads at the same time. A parsed source document can be transformed several times,
+    e.g. into the CRF and the annotated CRF, without parsing it again. Use get_saxon_transformer() for
+    the transformer shared by the whole process.
+    """
 
-    saxonhe = PySaxonProcessor(license=False)
-    logger.info(f"Saxon-HE version: {saxonhe.version}")
+    def __init__(self):
+        self.processor = PySaxonProcessor(license=False)
+        logger.info(f"Saxon-HE version: {self.processor.version}")
+        self._xslt_processor = self.processor.new_xslt30_processor()
+        self._executables = {}
+        self._lock = threading.Lock()
+
+    def executable(self, xsl_path, **kwargs):
+        """
+        Returns the compiled stylesheet for xsl_path with the given parameters set, compiling it on first use
+        or when the file has changed.
+
+        Args:
+            xsl_path (str): Path to the XSLT stylesheet file.
+            **kwargs: Integer stylesheet parameters, e.g. displayAnnotations=0.
+        """
+        xsl_path = os.path.abspath(xsl_path)
+        key = (xsl_path, tuple(sorted(kwargs.items())))
+        mtime = os.stat(xsl_path).st_mtime_ns
+        with self._lock:
+            cached = self._executables.get(key)
+            if cached is None or cached[0] != mtime:
+                executable = self._xslt_processor.compile_stylesheet(stylesheet_file=xsl_path)
+                for name, value in kwargs.items():
+                    executable.set_parameter(name, self.processor.make_integer_value(value))
+                cached = (mtime, executable)
+                self._executables[key] = cached
+        return cached[1]
+
+    def parse(self, xml_path=None, xml_bytes=None):
+        """
+        Parses an XML document from a file or from UTF-8 encoded bytes and returns the XDM node.
+
+        Args:
+            xml_path (str, optional): Path to the XML file.
+            xml_bytes (bytes, optional): UTF-8 encoded XML document; used when xml_path is None.
+        """
+        if xml_path is not None:
+            return self.processor.parse_xml(xml_file_name=str(xml_path))
+        return self.processor.parse_xml(xml_text=xml_bytes.decode("utf-8"))
+
+    def transform(self, document, xsl_path, output_path=None, **kwargs):
+        """
+        Transforms a parsed XML document with a compiled stylesheet.
+
+        Args:
+            document: XDM node returned by parse().
+            xsl_path (str): Path to the XSLT stylesheet file.
+            output_path (str, optional): Path to save the transformation result. When None, nothing is written.
+            **kwargs: Integer stylesheet parameters, e.g. displayAnnotations=0. Parameters that are
+                not passed take the default value declared in the stylesheet.
+
+        Returns:
+            str: The transformation result.
+        """
+        executable = self.executable(xsl_path, **kwargs)
+        result = executable.transform_to_string(xdm_node=document)
+
+        if output_path:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(result)
+            logger.info(f"HTML transformation completed successfully... {output_path}")
+        return result
+
+    def transform_crf(self, document, xsl_path, crf_path=None, acrf_path=None):
+        """
+        Renders the CRF and the annotated CRF from one parsed ODM document.
+
+        Args:
+            document: XDM node of the ODM document returned by parse().
+            xsl_path (str): Path to the CRF XSLT stylesheet, which takes a displayAnnotations parameter.
+            crf_path (str, optional): Path to save the CRF HTML.
+            acrf_path (str, optional): Path to save the annotated CRF HTML.
+
+        Returns:
+            tuple: The CRF HTML and the annotated CRF HTML.
+        """
+        crf_html = self.transform(document, xsl_path, crf_path, displayAnnotations=0)
+        acrf_html = self.transform(document, xsl_path, acrf_path, displayAnnotations=1)
+        return crf_html, acrf_html
+
+
+_saxon_transformer = None
+_saxon_transformer_lock = threading.Lock()
+
+
+def get_saxon_transformer():
+    """
+    Returns the SaxonTransformer shared by the process, creating it on first use.
 
-    saxonproc = saxonhe.new_xslt30_processor()
+    Threads that call this at the same time, e.g. concurrent pipeline stages, get the same transformer.
+    """
+    global _saxon_transformer
+    with _saxon_transformer_lock:
+        if _saxon_transformer is None:
+            _saxon_transformer = SaxonTransformer()
+    return _saxon_transformer
 
-    for key, value in kwargs.items():
-        parameter_value = saxonhe.make_integer_value(value)
-        saxonproc.set_parameter(key, parameter_value)
 
-    executable = saxonproc.compile_stylesheet(stylesheet_file=str(xsl_path))
+def transform_xml_saxonche(file_path, xsl_path, output_path, **kwargs):
+    transformer = get_saxon_transformer()
+    document = transformer.parse(xml_path=file_path)
+    transformer.transform(document, xsl_path, output_path, **kwargs)
 
-    document = saxonhe.parse_xml(xml_file_name=str(file_path))
 
-    executable.transform_to_file(output_file=str(output_path), xdm_node=document)
+def transform_xml_bytes_saxonche(xml_bytes, xsl_path, output_path=None, **kwargs):
+    """
+    Transforms an in-memory XML document using an XSLT stylesheet, without reading the XML from disk.
+
+    Args:
+        xml_bytes (bytes): UTF-8 encoded XML document, e.g. an odmlib tree written to a BytesIO buffer.
+        xsl_path (str): Path to the XSLT stylesheet file.
+        output_path (str, optional): Path to save the transformation result. When None, nothing is written.
+        **kwargs: Integer stylesheet parameters, e.g. displayAnnotations=0.
 
-    logger.info(f"HTML transformation completed successfully... {output_path}")
+    Returns:
+        str: The transformation result.
+    """
+    transformer = get_saxon_transformer()
+    document = transformer.parse(xml_bytes=xml_bytes)
+    return transformer.transform(document, xsl_path, output_path, **kwargs)
 
 
 def create_crf_html(odm_file, verbose=False):
@@ -184,24 +472,129 @@ def gen_codelist_items(cl) -> list:
 
 
 def update_zip_file(zip_path, file_to_replace, new_file_path):
-    if os.path.exists(zip_path):
-        # Create a temporary file to build the new ZIP archive
-        temp_zip_path = os.path.join(tempfile.gettempdir(), os.path.basename(zip_path) + ".tmp")
+    write_zip_entries(zip_path, {file_to_replace: Path(new_file_path)})
+
 
-        with zipfile.ZipFile(zip_path, 'r') as original_zip, \
-                zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
+def update_zip_file_data(zip_path, file_to_replace, data):
+    """
+    Adds or replaces a file in a ZIP archive with in-memory content, without writing it to disk first.
 
-            # Add the new/updated file to the new ZIP archive
-            new_zip.write(new_file_path, arcname=file_to_replace)
+    Args:
+        zip_path (str): Path to the ZIP archive; it is created if it does not exist.
+        file_to_replace (str): Name of the file in the archive.
+        data (bytes | str): Content of the file; a str is stored UTF-8 encoded.
+    """
+    write_zip_entries(zip_path, {file_to_replace: data})
 
-            # Copy all other files from the original ZIP to the new ZIP
-            for item in original_zip.infolist():
-                if item.filename != file_to_replace:
-                    new_zip.writestr(item, original_zip.read(item.filename))
 
-        # Replace the original ZIP file with the new one
-        os.remove(zip_path)
-        os.rename(temp_zip_path, zip_path)
+def write_zip_entries(zip_path, entries, date_time=None):
+    """
+    Adds or replaces several files in a ZIP archive, writing the archive once.
+
+    The new entries are written first, then the members of an existing archive that are not replaced are
+    copied over. The archive is built next to zip_path and moved over it when complete.
+
+    Args:
+        zip_path (str | Path): Path to the ZIP archive; it is created if it does not exist.
+        entries (dict): Content of each file, keyed by its name in the archive. A value is a file path
+            (os.PathLike), in-memory content (bytes, or a str stored UTF-8 encoded), or an iterable of bytes
+            chunks that is streamed into the entry, e.g. a generator.
+        date_time (tuple, optional): Modification time (year, month, day, hour, minute, second) of the new
+            entries, for reproducible archives; defaults to the current time, or the file time for file paths.
+    """
+    zip_path = os.fspath(zip_path)
+    temp_zip_path = zip_path + ".tmp"
+    with zipfile.ZipFile(temp_zip_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
+        for name, content in entries.items():
+            _write_zip_entry(new_zip, name, content, date_time)
+
+        if os.path.exists(zip_path):
+            with zipfile.ZipFile(zip_path, 'r') as original_zip:
+                for item in original_zip.infolist():
+                    if item.filename not in entries:
+                        copied_item = zipfile.ZipInfo(item.filename, date_time=item.date_time)
+                        copied_item.compress_type = item.compress_type
+                        copied_item.external_attr = item.external_attr
+                        with original_zip.open(item) as source, new_zip.open(copied_item, 'w') as target:
+                            shutil.copyfileobj(source, target)
+
+    os.replace(temp_zip_path, zip_path)
+
+
+def _write_zip_entry(zipf, name, content, date_time=None):
+    if isinstance(content, os.PathLike) and date_time is None:
+        zipf.write(content, arcname=name)
+        return
+
+    entry = zipfile.ZipInfo(name, date_time=date_time or time.localtime(time.time())[:6])
+    entry.compress_type = zipf.compression
+    entry.external_attr = 0o600 << 16
+    if isinstance(content, (bytes, str)):
+        zipf.writestr(entry, content)
+    elif isinstance(content, os.PathLike):
+        with open(content, 'rb') as source, zipf.open(entry, 'w') as target:
+            shutil.copyfileobj(source, target)
     else:
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            zipf.write(new_file_path, file_to_replace)
+        with zipf.open(entry, 'w') as target:
+            for chunk in content:
+                target.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+
+def content_hash(*parts):
+    """
+    Returns a SHA-256 digest of several inputs, e.g. to find out whether the inputs of a build have changed.
+
+    Args:
+        *parts: The inputs. A DataFrame is hashed by its column names and values, a file path (os.PathLike) by
+            the content of the file, bytes as they are, and any other value by its str().
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            digest.update(repr(list(part.columns)).encode("utf-8"))
+            digest.update(pd.util.hash_pandas_object(part, index=False).values.tobytes())
+        elif isinstance(part, os.PathLike):
+            with open(part, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        elif isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def read_build_manifest(manifest_file):
+    """
+    Reads a build manifest written by write_build_manifest.
+
+    Args:
+        manifest_file (str | Path): Path to the manifest.
+    Returns:
+        dict: The manifest; empty when the file does not exist or cannot be read.
+    """
+    try:
+        with open(manifest_file, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable build manifest {manifest_file}: {e}")
+        return {}
+
+
+def write_build_manifest(manifest_file, manifest):
+    """
+    Writes a build manifest as JSON; the file is replaced only when the new manifest is complete.
+
+    Args:
+        manifest_file (str | Path): Path to the manifest.
+        manifest (dict): The manifest to write.
+    """
+    temp_manifest_file = f"{manifest_file}.tmp"
+    with open(temp_manifest_file, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_manifest_file, manifest_file)